@@ -1,64 +1,127 @@
 #!/usr/bin/env python3
 """Generate icon files for the application"""
 
-from PIL import Image, ImageDraw, ImageFont
+import PIL
+from PIL import Image, ImageDraw
+import hashlib
+import io
 import os
+import shutil
+import subprocess
+import sys
 
-def create_icon():
+# Polygon fills are not anti-aliased, so draw at this multiple and downscale
+SUPERSAMPLE = 4
+
+# ICON_FAST=1 trades file size for speed during development
+FAST = os.environ.get('ICON_FAST') == '1'
+
+OUTPUT_FILES = ('icon.ico', 'icon.png', 'icon.icns')
+HASH_FILE = 'icon.hash'
+
+def render_key():
+    """Hash everything the rendered bytes depend on: Pillow, FAST and this script"""
+    h = hashlib.blake2b(f"{PIL.__version__}:{FAST}".encode())
+    with open(__file__, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def is_up_to_date(key):
+    """True if all outputs exist and were rendered with the same inputs"""
+    if not all(os.path.exists(p) for p in OUTPUT_FILES):
+        return False
+    try:
+        with open(HASH_FILE) as f:
+            return f.read().strip() == key
+    except OSError:
+        return False
+
+def m_polygon(size, inset=0.2, stroke=0.14):
+    """Vertices of a block "M" scaled to a size x size tile"""
+    left, right = size * inset, size * (1 - inset)
+    top, bottom = size * inset * 1.1, size * (1 - inset * 1.1)
+    w = size * stroke
+    mid = size / 2
+    valley = top + (bottom - top) * 0.58
+    drop = w * 1.5
+    return [
+        (left, bottom), (left, top), (left + w, top),
+        (mid, valley),
+        (right - w, top), (right, top), (right, bottom), (right - w, bottom),
+        (right - w, top + drop),
+        (mid, valley + drop),
+        (left + w, top + drop), (left + w, bottom),
+    ]
+
+def save_image(img, path, **params):
+    """Encode in memory and write the file with a single write() call"""
+    buf = io.BytesIO()
+    img.save(buf, **params)
+    with open(path, 'wb') as f:
+        f.write(buf.getbuffer())
+
+def optimize_png(path):
+    """Losslessly recompress a PNG with oxipng or ECT when one is installed"""
+    if shutil.which('oxipng'):
+        cmd = ['oxipng', '-o', 'max', '--strip', 'safe', path]
+    elif shutil.which('ect'):
+        cmd = ['ect', '-9', '-strip', path]
+    else:
+        return
+    subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def create_icon(force=False):
     """Create the purple M icon in various sizes"""
+    key = render_key()
+    if not force and is_up_to_date(key):
+        print("Icons are up to date")
+        return
+
     sizes = [16, 32, 48, 64, 128, 256]
-    images = []
-
-    for size in sizes:
-        # Create image with transparent background
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # Draw rounded rectangle (purple background)
-        corner_radius = size // 6
-        draw.rounded_rectangle(
-            [0, 0, size-1, size-1],
-            radius=corner_radius,
-            fill='#7c3aed'
-        )
-
-        # Draw "M" text
-        font_size = int(size * 0.6)
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("C:\\Windows\\Fonts\\arial.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
-
-        # Center the text
-        text = "M"
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (size - text_width) // 2
-        y = (size - text_height) // 2 - bbox[1]
-
-        draw.text((x, y), text, fill='white', font=font)
-        images.append(img)
+    size = sizes[-1]
+
+    # Render a single master at the largest size; the ICO encoder derives
+    # the smaller sizes from it
+    canvas = size * SUPERSAMPLE
+    img = Image.new('RGBA', (canvas, canvas), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    # Draw rounded rectangle (purple background)
+    corner_radius = canvas // 6
+    draw.rounded_rectangle(
+        [0, 0, canvas-1, canvas-1],
+        radius=corner_radius,
+        fill='#7c3aed'
+    )
+
+    # Draw the "M" as a polygon, no font needed
+    draw.polygon(m_polygon(canvas), fill='white')
+
+    img = img.resize((size, size), Image.LANCZOS)
 
     # Save as ICO for Windows
-    images[0].save(
+    save_image(
+        img,
         'icon.ico',
         format='ICO',
-        sizes=[(s, s) for s in sizes],
-        append_images=images[1:]
+        sizes=[(s, s) for s in sizes]
     )
     print("Created icon.ico")
 
     # Save as PNG for other uses
-    images[-1].save('icon.png', format='PNG')
+    if FAST:
+        save_image(img, 'icon.png', format='PNG', compress_level=1)
+    else:
+        save_image(img, 'icon.png', format='PNG', optimize=True)
+        optimize_png('icon.png')
     print("Created icon.png (256x256)")
 
-    # Save as ICNS for macOS (just save the largest as PNG, macOS can use it)
-    images[-1].save('icon.icns', format='PNG')
+    # Save as ICNS for macOS (just the largest PNG, macOS can use it)
+    shutil.copyfile('icon.png', 'icon.icns')
     print("Created icon.icns")
 
+    with open(HASH_FILE, 'w') as f:
+        f.write(key)
+
 if __name__ == '__main__':
-    create_icon()
+    create_icon(force='--force' in sys.argv[1:])
@@ -3,10 +3,12 @@
 Martinez Orders - Professional WooCommerce Order Management
 """
 
+import functools
 import json
 import logging
 import os
 import re
+import selectors
 import shutil
 import socket
 import subprocess
@@ -15,60 +17,119 @@ import tempfile
 import threading
 import time
 import webbrowser
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Dict, Any, List, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+
+# JSON helpers work on UTF-8 bytes; orjson is used when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 # App version - bump this for each release
 APP_VERSION = "1.0.2"
 GITHUB_REPO = "SezSab/martinez-orders"
 
+# Per-user cache for data fetched from the network
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".martinez_orders")
+UPDATE_CACHE_FILE = "update_cache.json"
+UPDATE_CACHE_TTL = 6 * 3600  # seconds a cached release is trusted without asking GitHub
+STATUS_CACHE_FILE = "order_statuses.json"
+STATUS_CACHE_TTL = 3600  # order statuses only change when a plugin adds or removes one
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QFrame, QTableWidget, QTableWidgetItem,
     QHeaderView, QMessageBox, QGridLayout, QComboBox, QTabWidget, QTabBar,
     QStyledItemDelegate, QStyleOptionViewItem, QStyle, QDialog, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QModelIndex, QTimer, QRectF, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QModelIndex, QTimer, QRectF, QPointF, QRunnable, QThreadPool, QThread
 from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QBrush, QPen, QIcon, QPixmap
+from PyQt6 import sip
 
 
-class UpdateChecker(QThread):
-    """Background thread to check for updates"""
+class UpdateCheckerSignals(QObject):
+    """Signals for UpdateChecker - a QRunnable cannot define its own"""
     update_available = pyqtSignal(str, str)  # version, download_url
     no_update = pyqtSignal()
     error = pyqtSignal(str)
 
+
+class UpdateChecker(QRunnable):
+    """Background task to check for updates, run on the global QThreadPool"""
+
+    def __init__(self, max_age: float = 0):
+        super().__init__()
+        self.signals = UpdateCheckerSignals()
+        self.max_age = max_age  # accept a cached release this many seconds old
+
     def run(self):
         try:
-            url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                release = response.json()
-                latest_version = release['tag_name'].lstrip('v')
-
-                # Compare versions
-                if self._is_newer(latest_version, APP_VERSION):
-                    # Find the exe download URL
-                    download_url = None
-                    for asset in release.get('assets', []):
-                        if asset['name'].endswith('.exe'):
-                            download_url = asset['browser_download_url']
-                            break
-
-                    if download_url:
-                        self.update_available.emit(latest_version, download_url)
-                    else:
-                        self.no_update.emit()
-                else:
-                    self.no_update.emit()
-            elif response.status_code == 404:
-                self.no_update.emit()  # No releases yet
+            release = self._latest_release()
+            if release is None:
+                self.signals.no_update.emit()  # No releases yet
+                return
+
+            latest_version = release['tag_name'].lstrip('v')
+            download_url = release.get('download_url')
+
+            # Compare versions
+            if self._is_newer(latest_version, APP_VERSION) and download_url:
+                self.signals.update_available.emit(latest_version, download_url)
             else:
-                self.error.emit(f"GitHub API error: {response.status_code}")
+                self.signals.no_update.emit()
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+    def _latest_release(self) -> Optional[Dict[str, Any]]:
+        """Return {'tag_name', 'download_url'} for the latest release, or None if there is none.
+
+        A cached answer younger than max_age is used without a request; otherwise
+        the cached ETag is sent so an unchanged release costs a bodyless 304."""
+        cache = read_cache(UPDATE_CACHE_FILE) or {}
+        if self.max_age and 'tag_name' in cache and time.time() - cache.get('fetched_at', 0) < self.max_age:
+            return cache
+
+        url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+        headers = {}
+        if cache.get('etag') and 'tag_name' in cache:
+            headers['If-None-Match'] = cache['etag']
+        response = github_session().get(url, headers=headers, timeout=(3, 10))
+
+        if response.status_code == 304:
+            cache['fetched_at'] = time.time()
+        elif response.status_code == 200:
+            release = _json_loads(response.content)
+            # Find the exe download URL
+            download_url = None
+            for asset in release.get('assets', []):
+                if asset['name'].endswith('.exe'):
+                    download_url = asset['browser_download_url']
+                    break
+            cache = {
+                'etag': response.headers.get('ETag'),
+                'fetched_at': time.time(),
+                'tag_name': release['tag_name'],
+                'download_url': download_url,
+            }
+        elif response.status_code == 404:
+            return None
+        else:
+            raise RuntimeError(f"GitHub API error: {response.status_code}")
+
+        write_cache(UPDATE_CACHE_FILE, cache)
+        return cache
 
     def _is_newer(self, latest: str, current: str) -> bool:
         """Compare version strings (e.g., '1.0.1' > '1.0.0')"""
@@ -80,41 +141,185 @@ class UpdateChecker(QThread):
             return False
 
 
-class UpdateDownloader(QThread):
-    """Background thread to download update"""
+class UpdateDownloaderSignals(QObject):
+    """Signals for UpdateDownloader - a QRunnable cannot define its own"""
     progress = pyqtSignal(int)  # percentage
     finished = pyqtSignal(str)  # path to downloaded file
     error = pyqtSignal(str)
 
+
+class UpdateDownloader(QRunnable):
+    """Background task to download update, run on the global QThreadPool"""
+
+    RETRIES = 3  # attempts per download; each retry resumes where the last one stopped
+    SEGMENTS = 4  # parallel range requests when the server supports them
+    CHUNK_SIZE = 256 * 1024
+    WRITE_BUFFER = 1024 * 1024
+    MIN_SEGMENTED_SIZE = 1024 * 1024
+
     def __init__(self, download_url: str):
         super().__init__()
+        self.signals = UpdateDownloaderSignals()
         self.download_url = download_url
 
+    @staticmethod
+    def _download_dir() -> str:
+        """Folder for the downloaded exe - next to the running exe when possible,
+        so the installer can rename it into place instead of copying across volumes"""
+        if getattr(sys, 'frozen', False):
+            exe_dir = os.path.dirname(sys.executable)
+            if os.access(exe_dir, os.W_OK):
+                return exe_dir
+        return tempfile.gettempdir()
+
     def run(self):
-        try:
-            # Download to temp file
-            response = requests.get(self.download_url, stream=True, timeout=60)
-            response.raise_for_status()
+        temp_dir = self._download_dir()
+        temp_file = os.path.join(temp_dir, "MartinezOrders_update.exe")
+        part_file = temp_file + ".part"
+
+        if not os.path.exists(part_file):
+            try:
+                if self._download_segmented(part_file):
+                    os.replace(part_file, temp_file)
+                    self.signals.finished.emit(temp_file)
+                    return
+            except Exception as e:
+                # A segmented file has holes and cannot be resumed - start over below
+                logger.warning(f"Segmented update download failed ({e}), using a single connection")
+                try:
+                    os.remove(part_file)
+                except OSError:
+                    pass
+
+        for attempt in range(self.RETRIES):
+            try:
+                self._download(part_file)
+                os.replace(part_file, temp_file)
+                self.signals.finished.emit(temp_file)
+                return
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                if attempt == self.RETRIES - 1:
+                    self.signals.error.emit(str(e))
+                    return
+                logger.warning(f"Update download interrupted ({e}), resuming...")
+                time.sleep(2 ** attempt)
+            except Exception as e:
+                self.signals.error.emit(str(e))
+                return
+
+    def _download_segmented(self, part_file: str) -> bool:
+        """Fetch the file over several connections, one byte range each
+
+        Returns False without downloading anything if the server does not
+        advertise range support or the file is too small to be worth splitting."""
+        head = github_session().head(self.download_url, allow_redirects=True, timeout=(5, 30))
+        head.raise_for_status()
+        total_size = int(head.headers.get('content-length', 0))
+        if head.headers.get('Accept-Ranges', '').lower() != 'bytes' or total_size < self.MIN_SEGMENTED_SIZE:
+            return False
+
+        url = head.url  # the CDN location after redirects
+        step = -(-total_size // self.SEGMENTS)
+        ranges = [(lo, min(lo + step, total_size) - 1) for lo in range(0, total_size, step)]
 
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+        with open(part_file, 'wb') as f:
+            f.truncate(total_size)
 
-            # Create temp file
-            temp_dir = tempfile.gettempdir()
-            temp_file = os.path.join(temp_dir, "MartinezOrders_update.exe")
+        lock = threading.Lock()
+        state = {'downloaded': 0, 'progress': -1}
 
-            with open(temp_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+        def fetch(lo: int, hi: int):
+            response = github_session().get(url, headers={'Range': f"bytes={lo}-{hi}"}, stream=True, timeout=(5, 60))
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RuntimeError(f"Range request ignored: {response.status_code}")
+            # Separate handle per worker so seek/write never interleave
+            with open(part_file, 'r+b', buffering=self.WRITE_BUFFER) as f:
+                f.seek(lo)
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = int(downloaded * 100 / total_size)
-                            self.progress.emit(progress)
+                        with lock:
+                            state['downloaded'] += len(chunk)
+                            progress = int(state['downloaded'] * 100 / total_size)
+                            if progress == state['progress']:
+                                continue
+                            state['progress'] = progress
+                        self.signals.progress.emit(progress)
+
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="download") as pool:
+            for future in [pool.submit(fetch, lo, hi) for lo, hi in ranges]:
+                future.result()
+
+        if state['downloaded'] != total_size:
+            raise RuntimeError(f"Incomplete download: {state['downloaded']} of {total_size} bytes")
+        return True
+
+    def _download(self, part_file: str):
+        """Download into part_file, continuing a previous partial download when possible.
+
+        The partial file is only resumed with an If-Range validator (ETag or
+        Last-Modified) saved alongside it, so a changed asset restarts from zero."""
+        validator_file = part_file + ".validator"
+        resume_from = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+        validator = None
+        if resume_from:
+            try:
+                with open(validator_file, 'r') as f:
+                    validator = f.read().strip()
+            except OSError:
+                pass
 
-            self.finished.emit(temp_file)
-        except Exception as e:
-            self.error.emit(str(e))
+        headers = {}
+        if resume_from and validator:
+            headers['Range'] = f"bytes={resume_from}-"
+            headers['If-Range'] = validator
+
+        response = github_session().get(self.download_url, headers=headers, stream=True, timeout=(5, 60))
+        if headers and not response.ok:
+            # The server refused the resume (416 when a complete .part was left
+            # behind) - drop the partial file and fetch the whole asset again
+            logger.warning(f"Update resume rejected ({response.status_code}), restarting from zero")
+            response.close()
+            for path in (part_file, validator_file):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            response = github_session().get(self.download_url, stream=True, timeout=(5, 60))
+        response.raise_for_status()
+
+        if response.status_code == 206:
+            mode, downloaded = 'ab', resume_from
+        else:
+            # Full body - the server ignored the range or the asset changed
+            mode, downloaded = 'wb', 0
+            validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+            if validator:
+                with open(validator_file, 'w') as f:
+                    f.write(validator)
+
+        content_length = int(response.headers.get('content-length', 0))
+        total_size = downloaded + content_length if content_length else 0
+
+        last_progress = -1
+        with open(part_file, mode, buffering=self.WRITE_BUFFER) as f:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    if total_size > 0:
+                        progress = int(downloaded * 100 / total_size)
+                        # Only cross the thread boundary when the bar would move
+                        if progress != last_progress:
+                            last_progress = progress
+                            self.signals.progress.emit(progress)
+
+        try:
+            os.remove(validator_file)
+        except OSError:
+            pass
 
 
 class UpdateDialog(QDialog):
@@ -137,7 +342,7 @@ class UpdateDialog(QDialog):
 
         # Info label
         self.info_label = QLabel(f"New version {new_version} is available!\nCurrent version: {APP_VERSION}")
-        self.info_label.setFont(QFont("Segoe UI", 12))
+        self.info_label.setFont(_ui_font(12))
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.info_label)
 
@@ -162,7 +367,7 @@ class UpdateDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         self.download_btn = QPushButton("Download && Install")
-        self.download_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.download_btn.setFont(_ui_font(11, bold=True))
         self.download_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.download_btn.setStyleSheet("""
             QPushButton {
@@ -183,7 +388,7 @@ class UpdateDialog(QDialog):
         btn_layout.addWidget(self.download_btn)
 
         self.cancel_btn = QPushButton("Later")
-        self.cancel_btn.setFont(QFont("Segoe UI", 11))
+        self.cancel_btn.setFont(_ui_font(11))
         self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.cancel_btn.setStyleSheet("""
             QPushButton {
@@ -209,10 +414,10 @@ class UpdateDialog(QDialog):
         self.progress_bar.setValue(0)
 
         self.downloader = UpdateDownloader(self.download_url)
-        self.downloader.progress.connect(self._on_progress)
-        self.downloader.finished.connect(self._on_download_finished)
-        self.downloader.error.connect(self._on_download_error)
-        self.downloader.start()
+        self.downloader.signals.progress.connect(self._on_progress)
+        self.downloader.signals.finished.connect(self._on_download_finished)
+        self.downloader.signals.error.connect(self._on_download_error)
+        QThreadPool.globalInstance().start(self.downloader)
 
     def _on_progress(self, value: int):
         self.progress_bar.setValue(value)
@@ -243,7 +448,7 @@ class UpdateDialog(QDialog):
 
             # Create a batch script to:
             # 1. Wait for current process to exit
-            # 2. Replace the exe
+            # 2. Replace the exe (a rename when both are on the same volume)
             # 3. Start the new exe
             # 4. Delete the batch script
 
@@ -253,9 +458,8 @@ class UpdateDialog(QDialog):
             batch_content = f'''@echo off
 echo Updating Martinez Orders...
 timeout /t 2 /nobreak > nul
-copy /Y "{self.downloaded_file}" "{current_exe}"
+move /Y "{self.downloaded_file}" "{current_exe}"
 start "" "{current_exe}"
-del "{self.downloaded_file}"
 del "%~f0"
 '''
             with open(batch_script, 'w') as f:
@@ -287,6 +491,9 @@ CALL_STATUSES = {
     'Неотговорен_максимум': {'color': '#868e96', 'icon': '❌', 'text': 'Макс. опити'},
 }
 
+_CALL_STATUS_INDEX = {key: i for i, key in enumerate(CALL_STATUSES)}  # position in the call status dropdown
+_CALL_STATUS_LABELS = [f"{info['icon']} {info['text']}" for info in CALL_STATUSES.values()]
+
 # WooCommerce Order Status colors
 ORDER_STATUS_COLORS = {
     'pending': '#ffc107',      # Yellow - Pending payment
@@ -300,27 +507,121 @@ ORDER_STATUS_COLORS = {
     'checkout-draft': '#6c757d', # Gray - Draft
 }
 
+@functools.lru_cache(maxsize=256)
 def lighten_color(hex_color, factor=0.85):
     """Create a lighter version of a hex color for hover backgrounds"""
-    hex_color = hex_color.lstrip('#')
-    r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    v = int(hex_color.lstrip('#'), 16)
+    r, g, b = v >> 16, (v >> 8) & 0xFF, v & 0xFF
     r = int(r + (255 - r) * factor)
     g = int(g + (255 - g) * factor)
     b = int(b + (255 - b) * factor)
-    return f'#{r:02x}{g:02x}{b:02x}'
+    return f'#{(r << 16) | (g << 8) | b:06x}'
+
+
+@functools.lru_cache(maxsize=None)
+def _brush(color_hex: str) -> QBrush:
+    """Brush for a status or shop color, parsed once per color instead of per table cell"""
+    return QBrush(QColor(color_hex))
+
+
+@functools.lru_cache(maxsize=None)
+def _ui_font(size: int, bold: bool = False) -> QFont:
+    """Shared Segoe UI font; built on first use, once the QApplication exists"""
+    return QFont("Segoe UI", size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
+
+
+def _freeze_order_statuses(statuses: List[Dict[str, str]]) -> tuple:
+    """WooCommerce status dicts as ((slug, name), ...) with interned slugs, shared by every tab"""
+    return tuple((sys.intern(st['slug']), st['name']) for st in statuses)
+
+
+@functools.lru_cache(maxsize=8)
+def _order_status_lookups(order_statuses: tuple) -> tuple:
+    """(slug -> dropdown index, slug -> name, labels, slugs), built once per status list"""
+    index = {slug: i for i, (slug, _) in enumerate(order_statuses)}
+    names = dict(order_statuses)
+    labels = tuple(name for _, name in order_statuses)
+    slugs = tuple(slug for slug, _ in order_statuses)
+    return index, names, labels, slugs
+
+
+@functools.lru_cache(maxsize=1024)
+def _phone_tab_title(phone: Optional[str]) -> str:
+    """Title of a tab opened for a phone number, before its search comes back"""
+    if not phone:
+        return "New"
+    return f"{phone[:12]}..." if len(phone) > 12 else phone
+
+
+@functools.lru_cache(maxsize=1024)
+def _result_tab_title(phone: str, name: Optional[str]) -> str:
+    """Title once a search is done: the customer name, or the phone if nothing was found"""
+    if name is None:
+        return f"{phone[:10]}..."
+    if not name:
+        return phone[:10]
+    return f"{name[:15]}..." if len(name) > 15 else name
+
+
+# Status dropdown look; the popup items are painted by the combo delegates
+_COMBO_QSS_TEMPLATE = """
+    QComboBox {{
+        font-weight: bold;
+        font-size: 14px;
+        border: 2px solid {color};
+        border-radius: 6px;
+        padding: 6px 10px;
+        background-color: white;
+        color: {color};
+    }}
+    QComboBox:hover {{
+        background-color: {hover};
+        border-color: {color};
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        width: 25px;
+    }}
+    QComboBox QAbstractItemView {{
+        font-size: 14px;
+        padding: 0px;
+        background-color: white;
+        outline: none;
+    }}
+"""
 
 
-class ColoredComboDelegate(QStyledItemDelegate):
-    """Custom delegate for painting QComboBox items with individual colors"""
+def _combo_qss(color: str) -> str:
+    return _COMBO_QSS_TEMPLATE.format(color=color, hover=lighten_color(color, 0.7))
 
-    def __init__(self, color_map: dict, parent=None):
+
+# Finished stylesheets per status, so switching a status is a dict lookup
+_DEFAULT_COMBO_QSS = _combo_qss('#6c757d')
+_ORDER_COMBO_QSS = {slug: _combo_qss(color) for slug, color in ORDER_STATUS_COLORS.items()}
+_CALL_COMBO_QSS = {key: _combo_qss(info['color']) for key, info in CALL_STATUSES.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _item_palette(color_hex: str) -> tuple:
+    """Text color, selected brush and hover brush for a combo item, built once per color"""
+    color = QColor(color_hex)
+    return color, QBrush(color), QBrush(QColor(lighten_color(color_hex, 0.7)))
+
+
+class _ColoredItemDelegate(QStyledItemDelegate):
+    """Base delegate painting each combo item in its own color; subclasses map the item to a color"""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.color_map = color_map  # slug -> color hex string
+        self._font = None
+        self._selected_color = QColor('white')
+
+    def _color_for(self, key) -> str:
+        return '#333333'
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
-        # Get the slug (stored as UserRole data)
-        slug = index.data(Qt.ItemDataRole.UserRole)
-        color_hex = self.color_map.get(slug, '#333333')
+        # Get the key (stored as UserRole data)
+        color, selected_brush, hover_brush = _item_palette(self._color_for(index.data(Qt.ItemDataRole.UserRole)))
 
         painter.save()
 
@@ -330,25 +631,22 @@ class ColoredComboDelegate(QStyledItemDelegate):
 
         # Draw hover/selection background
         if is_hovered and not is_selected:
-            hover_color = QColor(lighten_color(color_hex, 0.7))
-            painter.fillRect(option.rect, QBrush(hover_color))
+            painter.fillRect(option.rect, hover_brush)
         elif is_selected:
-            painter.fillRect(option.rect, QBrush(QColor(color_hex)))
+            painter.fillRect(option.rect, selected_brush)
 
         # Draw text
         text = index.data(Qt.ItemDataRole.DisplayRole)
         text_rect = option.rect.adjusted(10, 0, -10, 0)
 
         # Set text color based on selection state
-        if is_selected:
-            painter.setPen(QColor('white'))
-        else:
-            painter.setPen(QColor(color_hex))
+        painter.setPen(self._selected_color if is_selected else color)
 
-        font = painter.font()
-        font.setBold(True)
-        font.setPointSize(14)
-        painter.setFont(font)
+        if self._font is None:
+            self._font = QFont(painter.font())
+            self._font.setBold(True)
+            self._font.setPointSize(14)
+        painter.setFont(self._font)
         painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
 
         painter.restore()
@@ -359,54 +657,64 @@ class ColoredComboDelegate(QStyledItemDelegate):
         return size
 
 
-class CallStatusComboDelegate(QStyledItemDelegate):
+class ColoredComboDelegate(_ColoredItemDelegate):
+    """Custom delegate for painting QComboBox items with individual colors"""
+
+    def __init__(self, color_map: dict, parent=None):
+        super().__init__(parent)
+        self.color_map = color_map  # slug -> color hex string
+
+    def _color_for(self, slug) -> str:
+        return self.color_map.get(slug, '#333333')
+
+
+class CallStatusComboDelegate(_ColoredItemDelegate):
     """Custom delegate for painting Call Status QComboBox items with individual colors"""
 
     def __init__(self, statuses: dict, parent=None):
         super().__init__(parent)
         self.statuses = statuses  # key -> {'color': hex, 'icon': str, 'text': str}
 
-    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
-        # Get the status key (stored as UserRole data)
-        status_key = index.data(Qt.ItemDataRole.UserRole)
-        status_info = self.statuses.get(status_key, {})
-        color_hex = status_info.get('color', '#333333')
+    def _color_for(self, status_key) -> str:
+        return self.statuses.get(status_key, {}).get('color', '#333333')
 
-        painter.save()
 
-        # Check states using proper PyQt6 enum
-        is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
-        is_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+class RowButtonDelegate(QStyledItemDelegate):
+    """Paints a table cell's text as a small button, so order rows need no QPushButton widgets"""
 
-        # Draw hover/selection background
-        if is_hovered and not is_selected:
-            hover_color = QColor(lighten_color(color_hex, 0.7))
-            painter.fillRect(option.rect, QBrush(hover_color))
-        elif is_selected:
-            painter.fillRect(option.rect, QBrush(QColor(color_hex)))
+    def __init__(self, color: str, hover_color: str, parent=None):
+        super().__init__(parent)
+        self._brush = QBrush(QColor(color))
+        self._hover_brush = QBrush(QColor(hover_color))
+        self._text_color = QColor('white')
+        self._font = None
 
-        # Draw text
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
         text = index.data(Qt.ItemDataRole.DisplayRole)
-        text_rect = option.rect.adjusted(10, 0, -10, 0)
+        if not text:
+            return
 
-        # Set text color based on selection state
-        if is_selected:
-            painter.setPen(QColor('white'))
-        else:
-            painter.setPen(QColor(color_hex))
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        font = painter.font()
-        font.setBold(True)
-        font.setPointSize(14)
-        painter.setFont(font)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+        # 28px high, like the old button (11px text + 6px padding)
+        rect = QRectF(option.rect).adjusted(6, 0, -6, 0)
+        rect.setTop(option.rect.center().y() - 14)
+        rect.setHeight(28)
 
-        painter.restore()
+        is_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._hover_brush if is_hovered else self._brush)
+        painter.drawRoundedRect(rect, 4, 4)
 
-    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex):
-        size = super().sizeHint(option, index)
-        size.setHeight(32)  # Ensure consistent row height
-        return size
+        if self._font is None:
+            self._font = QFont(option.font)
+            self._font.setPixelSize(11)
+        painter.setFont(self._font)
+        painter.setPen(self._text_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+        painter.restore()
 
 
 try:
@@ -415,9 +723,96 @@ except ImportError:
     print("Missing woocommerce. Run: pip install woocommerce")
     sys.exit(1)
 
+
+class SessionWooCommerceAPI(WooCommerceAPI):
+    """WooCommerce API client that sends requests through a shared requests.Session.
+
+    The upstream client calls requests.request() for every call, which opens
+    a new TCP/TLS connection each time instead of reusing a pooled one."""
+
+    def __init__(self, *args, session: requests.Session, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = session
+
+    def _API__request(self, method, endpoint, data, params=None, **kwargs):
+        # OAuth over plain HTTP signs the full URL - keep the upstream code path
+        if not self.is_ssl:
+            return super()._API__request(method, endpoint, data, params, **kwargs)
+
+        if params is None:
+            params = {}
+        auth = None
+        headers = {
+            "user-agent": self.user_agent,
+            "accept": "application/json"
+        }
+
+        if self.query_string_auth:
+            params.update({
+                "consumer_key": self.consumer_key,
+                "consumer_secret": self.consumer_secret
+            })
+        else:
+            auth = HTTPBasicAuth(self.consumer_key, self.consumer_secret)
+
+        if data is not None:
+            data = _json_dumps(data)
+            headers["content-type"] = "application/json;charset=utf-8"
+
+        return self.session.request(
+            method=method,
+            url=self._API__get_url(endpoint),
+            verify=self.verify_ssl,
+            auth=auth,
+            params=params,
+            data=data,
+            timeout=self.timeout,
+            headers=headers,
+            **kwargs
+        )
+
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT = re.compile(r'\D')
+# Longest first so a longer code is never shadowed by a shorter one
+_COUNTRY_PREFIXES = ('359', '98', '49', '44', '39', '34', '33', '31', '1')
+
+
+def read_cache(name: str) -> Optional[Dict[str, Any]]:
+    """Load a JSON cache file from CACHE_DIR, or None if missing/unreadable"""
+    try:
+        with open(os.path.join(CACHE_DIR, name), 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(name: str, data: Dict[str, Any]):
+    """Store a JSON cache file in CACHE_DIR; failures only cost a refetch"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, name), 'wb') as f:
+            f.write(_json_dumps(data))
+    except OSError as e:
+        logger.debug(f"Could not write cache {name}: {e}")
+
+
+_github_session: Optional[requests.Session] = None
+_github_session_lock = threading.Lock()
+
+
+def github_session() -> requests.Session:
+    """Shared session for GitHub API and release downloads, so TLS connections are reused"""
+    global _github_session
+    with _github_session_lock:
+        if _github_session is None:
+            _github_session = requests.Session()
+            # Room for the segmented downloader's parallel range requests
+            _github_session.mount("https://", HTTPAdapter(pool_connections=3, pool_maxsize=8))
+        return _github_session
+
 
 class Config:
     def __init__(self, config_path: str = "config.json"):
@@ -427,19 +822,20 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         if not os.path.exists(self.config_path):
             return {}
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
+        with open(self.config_path, 'rb') as f:
+            return _json_loads(f.read())
 
-    @property
+    # The file is read once and never written back, so each section is resolved once
+    @functools.cached_property
     def asterisk(self) -> Dict[str, Any]:
         return self.data.get('asterisk', {})
 
-    @property
+    @functools.cached_property
     def shops(self) -> List[Dict[str, Any]]:
         """Get list of shop configurations"""
         return self.data.get('shops', [])
 
-    @property
+    @functools.cached_property
     def woocommerce(self) -> Dict[str, Any]:
         """Legacy support - returns first shop config"""
         shops = self.shops
@@ -447,12 +843,31 @@ class Config:
             return shops[0]
         return self.data.get('woocommerce', {})
 
-    @property
+    @functools.cached_property
     def settings(self) -> Dict[str, Any]:
         return self.data.get('settings', {})
 
 
+@functools.lru_cache(maxsize=4096)
+def normalize_phone(phone: str) -> str:
+    """Reduce a phone number to its national digits (at most the last 10)"""
+    digits = _NON_DIGIT.sub('', phone)
+    if len(digits) > 10:
+        if digits.startswith('00'):
+            digits = digits[2:]
+        elif digits.startswith('0'):
+            digits = digits[1:]
+        for prefix in _COUNTRY_PREFIXES:
+            if digits.startswith(prefix) and len(digits) > 10:
+                digits = digits[len(prefix):]
+                break
+    return digits[-10:] if len(digits) >= 10 else digits
+
+
 class WooCommerceClient:
+    SEARCH_PAGE_SIZE = 100  # WooCommerce REST API maximum per_page
+    BATCH_SIZE = 100  # WooCommerce REST API maximum items per batch request
+
     def __init__(self, shop_config: Dict[str, Any]):
         """Initialize with a shop config dict containing url, consumer_key, consumer_secret, name, color"""
         self.shop_config = shop_config
@@ -460,26 +875,22 @@ class WooCommerceClient:
         self.shop_color = shop_config.get('color', '#7c3aed')
         self.shop_url = shop_config.get('url', '')
         self.odoo_url = shop_config.get('odoo_url', '')
-        self.wcapi = WooCommerceAPI(
+        # One keep-alive session per shop so TLS handshakes happen once, not per call
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        self.wcapi = SessionWooCommerceAPI(
             url=shop_config['url'],
             consumer_key=shop_config['consumer_key'],
             consumer_secret=shop_config['consumer_secret'],
             version="wc/v3",
-            timeout=15
+            timeout=15,
+            session=self.session
         )
+        # Runs the phone-format search variants side by side (at most five)
+        self._pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="search")
 
     def normalize_phone(self, phone: str) -> str:
-        digits = re.sub(r'\D', '', phone)
-        if len(digits) > 10:
-            if digits.startswith('00'):
-                digits = digits[2:]
-            elif digits.startswith('0'):
-                digits = digits[1:]
-            for prefix in ['1', '44', '49', '33', '39', '34', '31', '98', '359']:
-                if digits.startswith(prefix) and len(digits) > 10:
-                    digits = digits[len(prefix):]
-                    break
-        return digits[-10:] if len(digits) >= 10 else digits
+        return normalize_phone(phone)
 
     def search_orders_by_phone(self, phone: str) -> List[Dict[str, Any]]:
         """Search orders by phone - uses WooCommerce search API which searches ALL orders."""
@@ -491,34 +902,43 @@ class WooCommerceClient:
             seen_ids = set()
 
             # Build search variants - try different formats
-            search_variants = [phone]
-            if normalized_phone != phone:
-                search_variants.append(normalized_phone)
+            search_variants = [phone.strip(), normalized_phone]
             # Try with country code prefix for Bulgarian numbers
             if len(normalized_phone) == 9:
                 search_variants.append(f"+359{normalized_phone}")
                 search_variants.append(f"359{normalized_phone}")
                 search_variants.append(f"0{normalized_phone}")
+            # Drop empty and duplicate variants, keeping their order
+            search_variants = [v for v in dict.fromkeys(search_variants) if v]
+
+            # WooCommerce search is a substring match over ALL orders, so every hit
+            # for a variant containing the bare digits is also a hit for the digits
+            # themselves. Search those first and only query the variants that could
+            # add something, unless the first page came back full.
+            results = []
+            if normalized_phone:
+                results.append(self._search_orders(normalized_phone))
+                if len(results[0]) < self.SEARCH_PAGE_SIZE:
+                    search_variants = [v for v in search_variants if normalized_phone not in v]
+                else:
+                    search_variants = [v for v in search_variants if v != normalized_phone]
+            # The remaining variants are independent queries, so issue them concurrently
+            results.extend(self._pool.map(self._search_orders, search_variants))
+
+            # Variants overlap, so the same order can come back several times;
+            # judge each one only once
+            search_tail = normalized_phone[-9:] if len(normalized_phone) >= 9 else None
+            for orders in results:
+                for order in orders:
+                    if order['id'] in seen_ids:
+                        continue
+                    seen_ids.add(order['id'])
+                    billing = order.get('billing', {})
+                    billing_phone = billing.get('phone', '')
+                    billing_normalized = normalize_phone(billing_phone)
 
-            # WooCommerce search searches ALL orders in database
-            for search_term in search_variants:
-                response = self.wcapi.get("orders", params={
-                    "search": search_term,
-                    "per_page": 100
-                })
-
-                if response.status_code == 200:
-                    orders = response.json()
-                    for order in orders:
-                        if order['id'] in seen_ids:
-                            continue
-                        billing = order.get('billing', {})
-                        billing_phone = billing.get('phone', '')
-                        billing_normalized = self.normalize_phone(billing_phone)
-
-                        if self._phone_matches(normalized_phone, billing_normalized):
-                            seen_ids.add(order['id'])
-                            matching_orders.append(order)
+                    if self._phone_matches(normalized_phone, billing_normalized, search_tail):
+                        matching_orders.append(order)
 
             logger.info(f"[{self.shop_name}] Found {len(matching_orders)} matching orders")
             return matching_orders
@@ -527,21 +947,31 @@ class WooCommerceClient:
             logger.error(f"[{self.shop_name}] Error searching orders: {e}")
             return []
 
-    def _phone_matches(self, normalized_search: str, normalized_billing: str) -> bool:
-        """Check if two normalized phone numbers match"""
+    def _search_orders(self, search_term: str) -> List[Dict[str, Any]]:
+        """Run a single WooCommerce order search, returning [] on API errors"""
+        response = self.wcapi.get("orders", params={
+            "search": search_term,
+            "per_page": self.SEARCH_PAGE_SIZE
+        })
+        if response.status_code == 200:
+            return _json_loads(response.content)
+        return []
+
+    def _phone_matches(self, normalized_search: str, normalized_billing: str,
+                       search_tail: Optional[str] = None) -> bool:
+        """Check if two normalized phone numbers match.
+        search_tail may carry normalized_search[-9:] precomputed by the caller."""
         if not normalized_search or not normalized_billing:
             return False
 
-        # Direct containment check
-        if normalized_search in normalized_billing or normalized_billing in normalized_search:
-            return True
-
         # Last 9 digits comparison (handles country code differences)
-        if len(normalized_search) >= 9 and len(normalized_billing) >= 9:
-            if normalized_search[-9:] == normalized_billing[-9:]:
-                return True
+        if search_tail is None and len(normalized_search) >= 9:
+            search_tail = normalized_search[-9:]
+        if search_tail and len(normalized_billing) >= 9 and normalized_billing[-9:] == search_tail:
+            return True
 
-        return False
+        # Direct containment check
+        return normalized_search in normalized_billing or normalized_billing in normalized_search
 
     def get_order_url(self, order_id: int) -> str:
         base_url = self.shop_url.rstrip('/')
@@ -551,12 +981,7 @@ class WooCommerceClient:
         """Update the ElevenLabs_Call_Status meta for an order.
         Returns (success, message)"""
         try:
-            # Get current order to verify it exists
-            response = self.wcapi.get(f"orders/{order_id}")
-            if response.status_code != 200:
-                return False, f"Order not found: {response.status_code}"
-
-            # Update the meta data
+            # Update the meta data - a missing order comes back as 404
             data = {
                 "meta_data": [
                     {
@@ -569,11 +994,13 @@ class WooCommerceClient:
             response = self.wcapi.put(f"orders/{order_id}", data)
             if response.status_code == 200:
                 # Verify the update
-                updated_order = response.json()
+                updated_order = _json_loads(response.content)
                 for meta in updated_order.get('meta_data', []):
                     if meta.get('key') == 'ElevenLabs_Call_Status' and meta.get('value') == status:
                         return True, "Status updated successfully"
                 return True, "Status sent (unverified)"
+            elif response.status_code == 404:
+                return False, f"Order not found: {response.status_code}"
             else:
                 return False, f"API error: {response.status_code}"
 
@@ -581,13 +1008,66 @@ class WooCommerceClient:
             logger.error(f"Error updating call status: {e}")
             return False, str(e)
 
+    def batch_update_call_status(self, updates: List[tuple[int, str]]) -> Dict[int, tuple[bool, str]]:
+        """Set ElevenLabs_Call_Status on many orders via orders/batch.
+        Returns {order_id: (success, message)}"""
+        return self._batch_update(
+            [{"id": order_id, "meta_data": [{"key": "ElevenLabs_Call_Status", "value": status}]}
+             for order_id, status in updates]
+        )
+
+    def batch_update_order_status(self, updates: List[tuple[int, str]]) -> Dict[int, tuple[bool, str]]:
+        """Set the status of many orders via orders/batch.
+        Returns {order_id: (success, message)}"""
+        return self._batch_update([{"id": order_id, "status": status} for order_id, status in updates])
+
+    def _batch_update(self, items: List[Dict[str, Any]]) -> Dict[int, tuple[bool, str]]:
+        """POST update items to orders/batch, BATCH_SIZE at a time"""
+        results = {}
+        for start in range(0, len(items), self.BATCH_SIZE):
+            chunk = items[start:start + self.BATCH_SIZE]
+            try:
+                response = self.wcapi.post("orders/batch", {"update": chunk})
+                if response.status_code != 200:
+                    for item in chunk:
+                        results[item['id']] = (False, f"API error: {response.status_code}")
+                    continue
+                for order in _json_loads(response.content).get('update', []):
+                    # Failed items come back as {"id": ..., "error": {"code": ..., "message": ...}}
+                    error = order.get('error')
+                    if error:
+                        results[order.get('id')] = (False, error.get('message', 'Update failed'))
+                    else:
+                        results[order.get('id')] = (True, "Status updated successfully")
+            except Exception as e:
+                logger.error(f"[{self.shop_name}] Error in batch update: {e}")
+                for item in chunk:
+                    results[item['id']] = (False, str(e))
+        return results
+
     def get_order_statuses(self) -> List[Dict[str, str]]:
+        """Get available order statuses, cached on disk for STATUS_CACHE_TTL.
+        Returns list of dicts with 'slug' and 'name' keys."""
+        cache = read_cache(STATUS_CACHE_FILE) or {}
+        cached = cache.get(self.shop_url)
+        if cached and time.time() - cached.get('fetched_at', 0) < STATUS_CACHE_TTL:
+            return cached['statuses']
+
+        statuses = self._fetch_order_statuses()
+        if statuses:
+            cache[self.shop_url] = {'fetched_at': time.time(), 'statuses': statuses}
+            write_cache(STATUS_CACHE_FILE, cache)
+            return statuses
+        # Shop unreachable - a stale list still beats an empty dropdown
+        return cached['statuses'] if cached else []
+
+    def _fetch_order_statuses(self) -> List[Dict[str, str]]:
         """Get available order statuses from WooCommerce API.
         Returns list of dicts with 'slug' and 'name' keys."""
         try:
             response = self.wcapi.get("orders/statuses")
             if response.status_code == 200:
-                statuses = response.json()
+                statuses = _json_loads(response.content)
                 # WooCommerce API can return either a dict or a list
                 if isinstance(statuses, dict):
                     return [{'slug': slug, 'name': name} for slug, name in statuses.items()]
@@ -611,7 +1091,7 @@ class WooCommerceClient:
             data = {"status": status}
             response = self.wcapi.put(f"orders/{order_id}", data)
             if response.status_code == 200:
-                updated_order = response.json()
+                updated_order = _json_loads(response.content)
                 if updated_order.get('status') == status:
                     return True, "Order status updated successfully"
                 return True, "Status sent (unverified)"
@@ -637,7 +1117,7 @@ class WooCommerceClient:
             })
 
             if response.status_code == 200:
-                orders = response.json()
+                orders = _json_loads(response.content)
                 # Filter to partial match on order number (case-insensitive)
                 matching = [o for o in orders if order_number in str(o.get('number', '')).upper()]
                 if matching:
@@ -645,20 +1125,30 @@ class WooCommerceClient:
                     return matching
 
             # Method 2: Try fetching recent orders and filtering
-            # This helps when using custom order number plugins
+            # This helps when using custom order number plugins. Only id and
+            # number are requested; full orders are fetched for the hits alone.
             response = self.wcapi.get("orders", params={
                 "per_page": 100,
                 "orderby": "date",
-                "order": "desc"
+                "order": "desc",
+                "_fields": "id,number"
             })
 
             if response.status_code == 200:
-                orders = response.json()
+                orders = _json_loads(response.content)
                 # Filter to partial match on order number (case-insensitive)
-                matching = [o for o in orders if order_number in str(o.get('number', '')).upper()]
-                if matching:
-                    logger.info(f"Found {len(matching)} order(s) matching '{order_number}' in recent orders")
-                    return matching
+                ids = [o['id'] for o in orders if order_number in str(o.get('number', '')).upper()]
+                if ids:
+                    response = self.wcapi.get("orders", params={
+                        "include": ",".join(str(i) for i in ids),
+                        "per_page": len(ids),
+                        "orderby": "date",
+                        "order": "desc"
+                    })
+                    if response.status_code == 200:
+                        matching = _json_loads(response.content)
+                        logger.info(f"Found {len(matching)} order(s) matching '{order_number}' in recent orders")
+                        return matching
 
             logger.info(f"No order found matching '{order_number}'")
             return []
@@ -675,6 +1165,7 @@ class MultiShopClient:
         self.config = config
         self.clients: List[WooCommerceClient] = []
         self._order_to_client: Dict[int, WooCommerceClient] = {}
+        self._clients_by_name: Dict[str, WooCommerceClient] = {}
 
         # Create a client for each configured shop
         for shop_config in config.shops:
@@ -694,12 +1185,24 @@ class MultiShopClient:
             except Exception as e:
                 logger.error(f"Failed to initialize legacy shop: {e}")
 
-    def search_orders_by_phone(self, phone: str) -> List[Dict[str, Any]]:
-        """Search all shops for orders matching phone number"""
-        all_orders = []
+        # Order IDs are only unique within a shop; the shop name tagged onto
+        # each order is what identifies its client
         for client in self.clients:
+            self._clients_by_name.setdefault(client.shop_name, client)
+
+        # Long-lived pool so every search fans out to all shops at once
+        # without paying thread start-up each time
+        self._pool = ThreadPoolExecutor(max_workers=max(len(self.clients), 1),
+                                        thread_name_prefix="shop")
+
+    def _search_all_shops(self, method: str, query: str) -> List[Dict[str, Any]]:
+        """Run a WooCommerceClient search method on all shops concurrently"""
+        futures = [(client, self._pool.submit(getattr(client, method), query))
+                   for client in self.clients]
+        all_orders = []
+        for client, future in futures:
             try:
-                orders = client.search_orders_by_phone(phone)
+                orders = future.result()
                 # Tag each order with shop info
                 for order in orders:
                     order['_shop_name'] = client.shop_name
@@ -713,31 +1216,22 @@ class MultiShopClient:
         all_orders.sort(key=lambda o: o.get('date_created', ''), reverse=True)
         return all_orders
 
+    def search_orders_by_phone(self, phone: str) -> List[Dict[str, Any]]:
+        """Search all shops for orders matching phone number"""
+        return self._search_all_shops('search_orders_by_phone', phone)
+
     def get_order_by_number(self, order_number: str) -> List[Dict[str, Any]]:
         """Search all shops for an order by number"""
-        all_orders = []
-        for client in self.clients:
-            try:
-                orders = client.get_order_by_number(order_number)
-                for order in orders:
-                    order['_shop_name'] = client.shop_name
-                    order['_shop_color'] = client.shop_color
-                    order['_shop_odoo_url'] = client.odoo_url
-                    self._order_to_client[order['id']] = client
-                all_orders.extend(orders)
-            except Exception as e:
-                logger.error(f"Error searching {client.shop_name}: {e}")
-        # Sort by date, newest first
-        all_orders.sort(key=lambda o: o.get('date_created', ''), reverse=True)
-        return all_orders
+        return self._search_all_shops('get_order_by_number', order_number)
 
-    def get_client_for_order(self, order_id: int) -> Optional[WooCommerceClient]:
+    def get_client_for_order(self, order_id: int, shop_name: Optional[str] = None) -> Optional[WooCommerceClient]:
         """Get the WooCommerceClient that owns a specific order"""
-        return self._order_to_client.get(order_id)
+        client = self._clients_by_name.get(shop_name) if shop_name else None
+        return client or self._order_to_client.get(order_id)
 
-    def get_order_url(self, order_id: int) -> str:
+    def get_order_url(self, order_id: int, shop_name: Optional[str] = None) -> str:
         """Get the admin URL for an order"""
-        client = self.get_client_for_order(order_id)
+        client = self.get_client_for_order(order_id, shop_name)
         if client:
             return client.get_order_url(order_id)
         # Fallback to first client
@@ -745,20 +1239,47 @@ class MultiShopClient:
             return self.clients[0].get_order_url(order_id)
         return ""
 
-    def update_call_status(self, order_id: int, status: str) -> tuple[bool, str]:
+    def update_call_status(self, order_id: int, status: str, shop_name: Optional[str] = None) -> tuple[bool, str]:
         """Update call status for an order"""
-        client = self.get_client_for_order(order_id)
+        client = self.get_client_for_order(order_id, shop_name)
         if client:
             return client.update_call_status(order_id, status)
         return False, "Unknown order source"
 
-    def update_order_status(self, order_id: int, status: str) -> tuple[bool, str]:
+    def update_order_status(self, order_id: int, status: str, shop_name: Optional[str] = None) -> tuple[bool, str]:
         """Update order status"""
-        client = self.get_client_for_order(order_id)
+        client = self.get_client_for_order(order_id, shop_name)
         if client:
             return client.update_order_status(order_id, status)
         return False, "Unknown order source"
 
+    def batch_update_call_status(self, updates: List[tuple[int, str, Optional[str]]]) -> Dict[tuple[Optional[str], int], tuple[bool, str]]:
+        """Update call status for many (order_id, status, shop_name) entries, one batch per shop"""
+        return self._batch_by_shop('batch_update_call_status', updates)
+
+    def batch_update_order_status(self, updates: List[tuple[int, str, Optional[str]]]) -> Dict[tuple[Optional[str], int], tuple[bool, str]]:
+        """Update order status for many (order_id, status, shop_name) entries, one batch per shop"""
+        return self._batch_by_shop('batch_update_order_status', updates)
+
+    def _batch_by_shop(self, method: str, updates: List[tuple[int, str, Optional[str]]]) -> Dict[tuple[Optional[str], int], tuple[bool, str]]:
+        """Group updates by owning client and run the per-shop batches concurrently.
+        Results are keyed by (shop_name, order_id) since IDs repeat across shops."""
+        results = {}
+        by_client: Dict[WooCommerceClient, List[tuple[int, str]]] = {}
+        for order_id, status, shop_name in updates:
+            client = self.get_client_for_order(order_id, shop_name)
+            if client:
+                by_client.setdefault(client, []).append((order_id, status))
+            else:
+                results[(shop_name, order_id)] = (False, "Unknown order source")
+
+        futures = [(client, self._pool.submit(getattr(client, method), items))
+                   for client, items in by_client.items()]
+        for client, future in futures:
+            for order_id, result in future.result().items():
+                results[(client.shop_name, order_id)] = result
+        return results
+
     def get_order_statuses(self) -> List[Dict[str, str]]:
         """Get order statuses from first available shop"""
         if self.clients:
@@ -773,72 +1294,90 @@ class SignalEmitter(QObject):
     status_update_result = pyqtSignal(int, bool, str)  # row, success, message
 
 
+# Tasker sends a flat {"phone": "..."} body; a plain (escape-free) string value
+# can be read straight from the bytes, anything else goes through the JSON parser
+_WEBHOOK_PHONE_RE = re.compile(rb'"phone"\s*:\s*"([^"\\]*)"')
+
+
+def _http_response(status: str, body: bytes = b'') -> bytes:
+    """Complete HTTP/1.0 response so a reply goes out in a single write"""
+    head = f"HTTP/1.0 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    return head.encode('ascii') + body
+
+
+_WEBHOOK_OK = _http_response('200 OK', b'{"status": "ok"}')
+_WEBHOOK_PHONE_REQUIRED = _http_response('400 Bad Request', b'{"error": "phone required"}')
+_WEBHOOK_RUNNING = _http_response('200 OK', b'{"status": "running"}')
+_WEBHOOK_NOT_FOUND = _http_response('404 Not Found')
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Handles Tasker requests; replies are prebuilt byte strings written in one go"""
+
+    def log_message(self, format, *args):
+        logging.debug(f"Webhook: {format % args}")
+
+    def _reply(self, response: bytes, code: int):
+        self.log_request(code)
+        self.wfile.write(response)
+
+    def do_POST(self):
+        if self.path != '/incoming-call':
+            self._reply(_WEBHOOK_NOT_FOUND, 404)
+            return
+
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(content_length)
+            match = _WEBHOOK_PHONE_RE.search(body)
+            if match:
+                phone = match.group(1).decode('utf-8')
+            else:
+                phone = _json_loads(body).get('phone', '')
+
+            if phone:
+                logging.info(f"Webhook: Incoming call from {phone}")
+                self.server.signals.incoming_call.emit(phone, {"source": "android"})
+                self._reply(_WEBHOOK_OK, 200)
+            else:
+                self._reply(_WEBHOOK_PHONE_REQUIRED, 400)
+        except Exception as e:
+            logging.error(f"Webhook error: {e}")
+            self._reply(_http_response('500 Internal Server Error', _json_dumps({"error": str(e)})), 500)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._reply(_WEBHOOK_RUNNING, 200)
+        else:
+            self._reply(_WEBHOOK_NOT_FOUND, 404)
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    """One thread per request so a stalled client cannot hold up the next call"""
+    daemon_threads = True  # don't keep the app alive for a hung handler
+    allow_reuse_address = True  # rebind straight after a restart
+
+    def __init__(self, address, signals: SignalEmitter):
+        self.signals = signals  # read by _WebhookHandler
+        super().__init__(address, _WebhookHandler)
+
+
 class WebhookServer:
     """HTTP server for receiving incoming call notifications from Android/Tasker"""
 
     def __init__(self, signals: SignalEmitter, port: int = 5039):
         self.signals = signals
         self.port = port
-        self.server: Optional[HTTPServer] = None
+        self.server: Optional[_WebhookHTTPServer] = None
         self.running = False
         self._thread: Optional[threading.Thread] = None
 
-    def _create_handler(self):
-        signals = self.signals
-
-        class WebhookHandler(BaseHTTPRequestHandler):
-            def log_message(self, format, *args):
-                logging.debug(f"Webhook: {format % args}")
-
-            def do_POST(self):
-                if self.path == '/incoming-call':
-                    try:
-                        content_length = int(self.headers.get('Content-Length', 0))
-                        body = self.rfile.read(content_length).decode('utf-8')
-                        data = json.loads(body)
-                        phone = data.get('phone', '')
-
-                        if phone:
-                            logging.info(f"Webhook: Incoming call from {phone}")
-                            signals.incoming_call.emit(phone, {"source": "android"})
-                            self.send_response(200)
-                            self.send_header('Content-Type', 'application/json')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({"status": "ok"}).encode())
-                        else:
-                            self.send_response(400)
-                            self.send_header('Content-Type', 'application/json')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({"error": "phone required"}).encode())
-                    except Exception as e:
-                        logging.error(f"Webhook error: {e}")
-                        self.send_response(500)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({"error": str(e)}).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-
-            def do_GET(self):
-                if self.path == '/health':
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({"status": "running"}).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-
-        return WebhookHandler
-
     def start(self):
-        if self.running:
+        if self.running or not self.port:
             return
 
         try:
-            handler = self._create_handler()
-            self.server = HTTPServer(('0.0.0.0', self.port), handler)
+            self.server = _WebhookHTTPServer(('0.0.0.0', self.port), self.signals)
             self.running = True
             self._thread = threading.Thread(target=self._serve, daemon=True)
             self._thread.start()
@@ -847,17 +1386,42 @@ class WebhookServer:
             logging.error(f"Failed to start webhook server: {e}")
 
     def _serve(self):
-        while self.running and self.server:
-            self.server.handle_request()
+        # serve_forever waits in select() between requests and is what
+        # shutdown() signals; a handle_request() loop would make stop() hang
+        self.server.serve_forever(poll_interval=0.5)
 
     def stop(self):
         self.running = False
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
         logging.info("Webhook server stopped")
 
 
+@functools.lru_cache(maxsize=2048)
+def _normalize_ami_number(number: str) -> str:
+    """Digits of an AMI caller number without leading zeros; the same few numbers recur on every event"""
+    return _NON_DIGIT.sub('', number).lstrip('0')
+
+
+_AMI_FRAME_END = re.compile(rb'\r?\n\r?\n')
+
+# Event types _process_event logs or matches on
+_WATCHED_EVENTS = frozenset({'DialBegin', 'DialState', 'Newstate', 'Newchannel', 'Dial', 'Bridge'})
+_WATCHED_EVENT_NAMES = frozenset(name.encode() for name in _WATCHED_EVENTS)  # as they arrive on the wire
+# Provider/trunk channels, or SIP peers named rather than numbered (SIP/provider-..., not SIP/1034-...)
+_EXTERNAL_CHANNEL_RE = re.compile(r'prov|trunk|^sip/[^\W\d_]', re.I)
+# Caller ID values that do not identify a caller
+_INVALID_CALLERS = frozenset({'<unknown>', '', 's', 'anonymous'})
+
+_AMI_FIELD_RE = re.compile(
+    r'^(Event|Channel|CallerIDNum|Uniqueid|Linkedid|ConnectedLineNum|Exten|DestChannel|DestCallerIDNum|ChannelStateDesc)'
+    r'[ \t]*:[ \t]*([^\r\n]*?)[ \t]*\r?$',
+    re.M
+)
+
+
 class AsteriskAMI:
     def __init__(self, config: Config, signals: SignalEmitter):
         self.host = config.asterisk.get('host', '')
@@ -870,13 +1434,18 @@ class AsteriskAMI:
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.running = False
-        self._processed_calls = set()
+        self._processed_calls: OrderedDict[str, None] = OrderedDict()  # LRU of emitted call keys
         # Track calls: LinkedID -> original CallerID from SIP trunk
         self._call_callers = {}  # LinkedID -> CallerID
         self._reconnect_delay = 5  # seconds between reconnect attempts
         self._auto_reconnect = True
+        # disconnect() writes a byte here to wake the event loop out of select()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
 
     def connect(self) -> bool:
+        if not self._auto_reconnect:
+            return False  # disconnect() was called; don't open a new socket
         if not self.host or not self.username:
             self.signals.connection_status.emit(False, "Not configured")
             return False
@@ -892,6 +1461,13 @@ class AsteriskAMI:
                     pass
 
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # AMI is small request/response frames - don't let Nagle hold them back
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Notice a silently dropped PBX link within about a minute
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in (('TCP_KEEPIDLE', 30), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3)):
+                if hasattr(socket, option):
+                    self.socket.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
             self.socket.settimeout(10)
             self.socket.connect((self.host, self.port))
 
@@ -902,7 +1478,8 @@ class AsteriskAMI:
             response = self.socket.recv(1024).decode('utf-8')
             if 'Success' in response:
                 self.connected = True
-                self.socket.settimeout(1)
+                # The event loop waits in select(), so reads never need a timeout
+                self.socket.settimeout(None)
                 self.signals.connection_status.emit(True, "Connected")
                 logger.info("AMI connected successfully")
                 return True
@@ -911,6 +1488,8 @@ class AsteriskAMI:
                 return False
 
         except Exception as e:
+            if not self._auto_reconnect:
+                return False  # socket shut down by disconnect()
             logger.error(f"AMI connection error: {e}")
             self.signals.connection_status.emit(False, "Connection failed")
             return False
@@ -919,16 +1498,40 @@ class AsteriskAMI:
         self._auto_reconnect = False
         self.running = False
         self.connected = False
+        self._wake()
         if self.socket:
+            # shutdown() first so a connect()/recv() blocked on another thread returns
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.socket.close()
             except:
                 pass
 
-    def start_listening(self):
-        self.running = True
-        self._auto_reconnect = True
-        threading.Thread(target=self._event_loop, daemon=True).start()
+    def listen(self):
+        """Process events on the calling thread until disconnect(); running is set by the caller"""
+        self._event_loop()
+
+    def _wake(self):
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass
+
+    def _drain_wakeup(self):
+        try:
+            while self._wakeup_r.recv(64):
+                pass
+        except OSError:
+            pass
+
+    def _wait(self, timeout: float):
+        """Sleep up to timeout seconds, returning early if disconnect() is called"""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wakeup_r, selectors.EVENT_READ)
+            selector.select(timeout)
 
     def _reconnect(self):
         """Attempt to reconnect to AMI with exponential backoff."""
@@ -940,7 +1543,7 @@ class AsteriskAMI:
             self.signals.connection_status.emit(False, f"Reconnecting in {delay}s...")
             logger.info(f"AMI reconnecting in {delay} seconds...")
 
-            time.sleep(delay)
+            self._wait(delay)
 
             if not self.running or not self._auto_reconnect:
                 break
@@ -954,7 +1557,15 @@ class AsteriskAMI:
         return False
 
     def _event_loop(self):
-        buffer = ""
+        buffer = bytearray()
+        # One receive buffer reused for every recv_into instead of a new bytes per read
+        chunk = bytearray(65536)
+        chunk_view = memoryview(chunk)
+        # Block until the PBX sends something or disconnect() wakes us -
+        # no periodic timeout just to re-check self.running
+        selector = selectors.DefaultSelector()
+        selector.register(self._wakeup_r, selectors.EVENT_READ)
+        watched_socket = None
         while self.running:
             # If not connected, try to reconnect
             if not self.connected:
@@ -965,71 +1576,89 @@ class AsteriskAMI:
                     break
 
             try:
-                data = self.socket.recv(4096).decode('utf-8')
-                if not data:
+                if watched_socket is not self.socket:
+                    if watched_socket is not None:
+                        selector.unregister(watched_socket)
+                    selector.register(self.socket, selectors.EVENT_READ)
+                    watched_socket = self.socket
+                ready = [key.fileobj for key, _ in selector.select()]
+                if self._wakeup_r in ready:
+                    self._drain_wakeup()
+                if self.socket not in ready:
+                    continue
+
+                received = self.socket.recv_into(chunk_view)
+                if not received:
                     self.connected = False
                     self.signals.connection_status.emit(False, "Disconnected")
                     logger.warning("AMI disconnected - no data received")
                     continue  # Will trigger reconnect
 
-                buffer += data
-
-                # Normalize line endings for cross-platform compatibility
-                # AMI typically sends \r\n, but we handle both \r\n and \n
-                buffer = buffer.replace('\r\n', '\n')
-
-                # Events are separated by double newline
-                while '\n\n' in buffer:
-                    event_str, buffer = buffer.split('\n\n', 1)
-                    if event_str.strip():
-                        self._process_event(event_str)
+                buffer += chunk_view[:received]
+
+                # Events are separated by a blank line; AMI typically sends \r\n,
+                # but we handle both \r\n and \n. Frames are decoded whole, so a
+                # multi-byte character split across reads is never cut in half.
+                pos = 0
+                pending = []
+                while True:
+                    frame_end = _AMI_FRAME_END.search(buffer, pos)
+                    if not frame_end:
+                        break
+                    start, pos = pos, frame_end.end()
+                    # Most frames are events we never look at - reject them on the
+                    # raw bytes of the first line so only watched frames get decoded
+                    if buffer.startswith(b'Event:', start):
+                        end = buffer.find(b'\n', start, frame_end.start())
+                        name = bytes(buffer[start + 6:end if end != -1 else frame_end.start()]).strip()
+                        if name not in _WATCHED_EVENT_NAMES:
+                            continue
+                    elif buffer.find(b'\nEvent:', start, frame_end.start()) == -1:
+                        continue  # Responses to our own actions carry no event
+                    event_str = buffer[start:frame_end.start()].decode('utf-8', 'replace')
+                    call = self._process_event(event_str)
+                    if call:
+                        pending.append(call)
+                del buffer[:pos]
+
+                # Hand everything from this read to the GUI thread after draining
+                for actual_caller, event in pending:
+                    logger.info(f">>> EMITTING incoming call from: {actual_caller}")
+                    self.signals.incoming_call.emit(actual_caller, event)
 
             except socket.timeout:
                 continue
             except Exception as e:
+                if not self.running:
+                    break  # socket closed by disconnect()
                 logger.error(f"AMI event loop error: {e}")
                 self.connected = False
                 self.signals.connection_status.emit(False, "Connection lost")
-                buffer = ""  # Clear buffer on reconnect
+                buffer.clear()  # Clear buffer on reconnect
                 continue  # Will trigger reconnect
+        selector.close()
 
     def _is_external_call(self, channel: str) -> bool:
         """Check if the channel is from an external SIP trunk (not internal extension)."""
-        if not channel:
-            return False
-        channel_lower = channel.lower()
-        if 'prov' in channel_lower or 'trunk' in channel_lower:
-            return True
-        if channel_lower.startswith('sip/'):
-            name_part = channel_lower[4:].split('-')[0]
-            if name_part and name_part[0].isalpha():
-                return True
-        return False
+        return bool(channel) and _EXTERNAL_CHANNEL_RE.search(channel) is not None
 
     def _normalize_number(self, number: str) -> str:
         """Remove leading zeros and country code prefix for comparison."""
-        digits = re.sub(r'\D', '', number)
-        # Remove leading zeros
-        digits = digits.lstrip('0')
-        return digits
+        return _normalize_ami_number(number)
 
     def _numbers_match(self, num1: str, num2: str) -> bool:
         """Check if two phone numbers match (handling different formats)."""
-        n1 = self._normalize_number(num1)
-        n2 = self._normalize_number(num2)
+        n1 = _normalize_ami_number(num1)
+        n2 = _normalize_ami_number(num2)
         if not n1 or not n2:
             return False
         # Check if one contains the other or last 9 digits match
         return n1 in n2 or n2 in n1 or (len(n1) >= 9 and len(n2) >= 9 and n1[-9:] == n2[-9:])
 
-    def _process_event(self, event_str: str):
-        event = {}
-        # Handle both \n and \r\n line endings
-        for line in event_str.strip().split('\n'):
-            line = line.strip()
-            if ':' in line:
-                key, value = line.split(':', 1)
-                event[key.strip()] = value.strip()
+    def _process_event(self, event_str: str) -> Optional[tuple[str, Dict[str, str]]]:
+        """Parse one frame; returns (caller, event) for a new incoming call to announce"""
+        # One scan for just the headers used below; handles \n and \r\n line endings
+        event = dict(_AMI_FIELD_RE.findall(event_str))
 
         event_type = event.get('Event', '')
         channel = event.get('Channel', '')
@@ -1053,35 +1682,36 @@ class AsteriskAMI:
         actual_caller = None
         matched = False
 
+        # "SIP/1034-0000001a" -> "SIP/1034", computed once for all methods below
+        dest_base = dest_channel.partition('-')[0].upper()
+        channel_base = channel.partition('-')[0].upper()
+
         # Method 1: DialBegin - when a call starts dialing to our extension
         # This is often the earliest and most reliable event
         if event_type == 'DialBegin' and self.watch_channel and dest_channel:
-            dest_base = dest_channel.upper().split('-')[0]
             if dest_base == self.watch_channel:
                 # CallerIDNum on the source channel is the external caller
-                actual_caller = caller_id if caller_id and caller_id not in ('<unknown>', '', 's', 'anonymous') else None
+                actual_caller = caller_id if caller_id not in _INVALID_CALLERS else None
                 if actual_caller:
                     matched = True
                     logger.info(f">>> MATCH via DialBegin! Caller {actual_caller} -> {self.watch_channel}")
 
         # Method 2: DialState with Ringing - backup detection
         if not matched and event_type == 'DialState' and self.watch_channel and dest_channel:
-            dest_base = dest_channel.upper().split('-')[0]
             if dest_base == self.watch_channel and state == 'Ringing':
-                actual_caller = caller_id if caller_id and caller_id not in ('<unknown>', '', 's', 'anonymous') else None
+                actual_caller = caller_id if caller_id not in _INVALID_CALLERS else None
                 if actual_caller:
                     matched = True
                     logger.info(f">>> MATCH via DialState! Caller {actual_caller} -> {self.watch_channel}")
 
         # Method 3: Newstate Ringing on watch_channel - original method as fallback
         if not matched and event_type == 'Newstate' and state == 'Ringing' and self.watch_channel and channel:
-            channel_base = channel.upper().split('-')[0]
             if channel_base == self.watch_channel:
                 # ConnectedLineNum is the actual caller for incoming calls
-                actual_caller = connected_num if connected_num and connected_num not in ('<unknown>', '', 's', 'anonymous') else None
+                actual_caller = connected_num if connected_num not in _INVALID_CALLERS else None
                 # Also try CallerIDNum if ConnectedLineNum is not available
                 if not actual_caller:
-                    actual_caller = caller_id if caller_id and caller_id not in ('<unknown>', '', 's', 'anonymous') else None
+                    actual_caller = caller_id if caller_id not in _INVALID_CALLERS else None
                 if actual_caller:
                     matched = True
                     logger.info(f">>> MATCH via Newstate! {self.watch_channel} ringing, caller: {actual_caller}")
@@ -1089,21 +1719,46 @@ class AsteriskAMI:
         # Emit signal if we found a caller
         if matched and actual_caller:
             call_key = f"call_{linked_id}_{actual_caller}"
-            if call_key not in self._processed_calls:
-                self._processed_calls.add(call_key)
-                # Clean up old entries
+            if call_key in self._processed_calls:
+                self._processed_calls.move_to_end(call_key)
+            else:
+                self._processed_calls[call_key] = None
+                # Forget the least recently seen call
                 if len(self._processed_calls) > 200:
-                    self._processed_calls = set(list(self._processed_calls)[-100:])
-                logger.info(f">>> EMITTING incoming call from: {actual_caller}")
-                self.signals.incoming_call.emit(actual_caller, event)
+                    self._processed_calls.popitem(last=False)
+                return actual_caller, event
+        return None
+
+
+class _AmiThread(QThread):
+    """Connects to the AMI and runs its event loop off the GUI thread"""
+
+    def __init__(self, ami: AsteriskAMI, parent=None):
+        super().__init__(parent)
+        self.ami = ami
+
+    def run(self):
+        # Armed before connect() and never again, so a disconnect() that lands
+        # while connecting is not undone and the loop below exits at once
+        self.ami.running = True
+        if self.ami.connect():
+            self.ami.listen()
 
 
 class LoadingOverlay(QWidget):
     """Semi-transparent overlay with spinning loader"""
 
+    RADIUS = 30
+    LINE_WIDTH = 4
+    ARC_LENGTH = 90
+    STEP = 20  # degrees per frame; 20 degrees / 60 ms keeps the old rotation speed
+    BACKGROUND = QColor(255, 255, 255, 200)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.angle = 0
+        self._spinner_pix: Optional[QPixmap] = None
+        self._text_pix: Optional[QPixmap] = None
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._rotate)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
@@ -1111,43 +1766,65 @@ class LoadingOverlay(QWidget):
 
     def showEvent(self, event):
         super().showEvent(event)
-        self.timer.start(30)  # ~33 FPS
+        self.timer.start(60)
 
     def hideEvent(self, event):
         super().hideEvent(event)
         self.timer.stop()
 
     def _rotate(self):
-        self.angle = (self.angle + 10) % 360
-        self.update()
+        self.angle = (self.angle + self.STEP) % 360
+        # Only the spinner moves - leave the rest of the overlay alone
+        extent = self.RADIUS + self.LINE_WIDTH
+        self.update(self.width() // 2 - extent, self.height() // 2 - extent, extent * 2, extent * 2)
+
+    def _render_pixmaps(self):
+        """Draw the arc and the caption once; frames then only rotate/blit them"""
+        dpr = self.devicePixelRatioF()
+        extent = self.RADIUS + self.LINE_WIDTH
+        self._spinner_pix = QPixmap(int(extent * 2 * dpr), int(extent * 2 * dpr))
+        self._spinner_pix.setDevicePixelRatio(dpr)
+        self._spinner_pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._spinner_pix)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor("#7c3aed"))
+        pen.setWidth(self.LINE_WIDTH)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        rect = QRectF(self.LINE_WIDTH, self.LINE_WIDTH, self.RADIUS * 2, self.RADIUS * 2)
+        painter.drawArc(rect, 0, self.ARC_LENGTH * 16)
+        painter.end()
+
+        self._text_pix = QPixmap(int(200 * dpr), int(30 * dpr))
+        self._text_pix.setDevicePixelRatio(dpr)
+        self._text_pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._text_pix)
+        painter.setPen(QColor("#666"))
+        painter.setFont(_ui_font(14))
+        painter.drawText(QRectF(0, 0, 200, 30), Qt.AlignmentFlag.AlignCenter, "Loading...")
+        painter.end()
 
     def paintEvent(self, event):
+        if self._spinner_pix is None or self._spinner_pix.devicePixelRatio() != self.devicePixelRatioF():
+            self._render_pixmaps()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
         # Semi-transparent background
-        painter.fillRect(self.rect(), QColor(255, 255, 255, 200))
+        painter.fillRect(event.rect(), self.BACKGROUND)
 
-        # Draw spinner in center
         center_x = self.width() // 2
         center_y = self.height() // 2
-        radius = 30
-        line_width = 4
-        arc_length = 90
 
-        pen = QPen(QColor("#7c3aed"))
-        pen.setWidth(line_width)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
-
-        rect = QRectF(center_x - radius, center_y - radius, radius * 2, radius * 2)
-        painter.drawArc(rect, self.angle * 16, arc_length * 16)
+        # "Loading..." text
+        painter.drawPixmap(center_x - 100, center_y + self.RADIUS + 20, self._text_pix)
 
-        # Draw "Loading..." text
-        painter.setPen(QColor("#666"))
-        painter.setFont(QFont("Segoe UI", 14))
-        text_rect = QRectF(0, center_y + radius + 20, self.width(), 30)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, "Loading...")
+        # Spinner - drawArc angles run counter-clockwise, rotate() clockwise
+        extent = self.RADIUS + self.LINE_WIDTH
+        painter.translate(center_x, center_y)
+        painter.rotate(-self.angle)
+        painter.drawPixmap(-extent, -extent, self._spinner_pix)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -1155,35 +1832,238 @@ class LoadingOverlay(QWidget):
             self.setGeometry(self.parent().rect())
 
 
+# Shared CustomerTab stylesheets - one string object per style for every tab
+_CARD_QSS = """
+    QFrame {
+        background-color: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+    }
+"""
+_BANNER_QSS = """
+    QLabel {
+        background-color: #fff3cd;
+        color: #856404;
+        border: 1px solid #ffeeba;
+        border-radius: 6px;
+        padding: 8px 12px;
+    }
+"""
+_SEARCH_INPUT_QSS = """
+    QLineEdit {
+        border: none;
+        padding: 8px;
+        background: transparent;
+    }
+"""
+_BLUE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #1a73e8;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+    }
+    QPushButton:hover {
+        background-color: #1557b0;
+    }
+    QPushButton:disabled {
+        background-color: #ccc;
+    }
+"""
+_PURPLE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #7c3aed;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+    }
+    QPushButton:hover {
+        background-color: #6d28d9;
+    }
+    QPushButton:disabled {
+        background-color: #ccc;
+    }
+"""
+_OPEN_BUTTON_QSS = """
+    QPushButton {
+        background-color: #7c3aed;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 15px 20px;
+    }
+    QPushButton:hover {
+        background-color: #6d28d9;
+    }
+    QPushButton:disabled {
+        background-color: #ccc;
+    }
+"""
+_ORDERS_TABLE_QSS = """
+    QTableWidget {
+        border: none;
+        background-color: white;
+        gridline-color: #f0f0f0;
+    }
+    QTableWidget::item {
+        padding: 12px;
+        border-bottom: 1px solid #f0f0f0;
+    }
+    QTableWidget::item:selected {
+        background-color: #e8f0fe;
+        color: #333;
+    }
+    QHeaderView::section {
+        background-color: #f8f9fa;
+        color: #666;
+        font-weight: 600;
+        font-size: 12px;
+        border: none;
+        border-bottom: 2px solid #e0e0e0;
+        padding: 12px 8px;
+    }
+"""
+
+
+def _order_meta(order: dict) -> dict:
+    """meta_data of an order as key -> value (first entry wins), built once and kept on the order"""
+    meta = order.get('_meta')
+    if meta is None:
+        meta = {}
+        for entry in order.get('meta_data', ()):
+            meta.setdefault(entry.get('key'), entry.get('value', ''))
+        order['_meta'] = meta
+    return meta
+
+
+def _money(value) -> float:
+    """Parse a WooCommerce amount string; anything malformed counts as 0"""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _order_line_texts(order: dict):
+    """One display line per product, paid shipping and fee line of an order"""
+    # Product lines - full format with SKU first
+    for item in order.get('line_items', ()):
+        sku = item.get('sku', '')
+        sku_text = f"[{sku}] " if sku else ""
+        yield f"{sku_text}{item.get('name', '')} x{item.get('quantity', 1)}"
+
+    # Shipping lines
+    for shipping in order.get('shipping_lines', ()):
+        if _money(shipping.get('total')) > 0:
+            yield f"🚚 {shipping.get('method_title', '') or shipping.get('method_id', 'Ship')}"
+
+    # Fee lines
+    for fee in order.get('fee_lines', ()):
+        yield f"⚙ {fee.get('name', 'Fee')}"
+
+
+def _join_nonempty(sep: str, *parts) -> str:
+    return sep.join(part for part in parts if part)
+
+
+def _order_display(order: dict) -> dict:
+    """Texts shown for an order (customer card and table cells), built once and kept on the order"""
+    display = order.get('_display')
+    if display is None:
+        billing = order.get('billing', {})
+        shop_name = order.get('_shop_name', '')
+        order_num = order.get('number', '')
+        date_raw = order.get('date_created') or ''
+        lines = list(_order_line_texts(order))
+        display = order['_display'] = {
+            'name': _join_nonempty(" ", billing.get('first_name'), billing.get('last_name')) or "Unknown",
+            'phone': billing.get('phone', '-'),
+            'email': billing.get('email', '-'),
+            'city': _join_nonempty(" ", billing.get('city'), billing.get('country')),
+            'address': _join_nonempty(" ", billing.get('address_1'), billing.get('address_2')) or '-',
+            # Shop initial as a badge when there are several shops
+            'num_text': f"[{shop_name[0].upper()}] #{order_num}" if shop_name else f"#{order_num}",
+            # Date - ISO YYYY-MM-DDTHH:MM:SS shown as dd.mm.yyyy
+            'date': date_raw[8:10] + '.' + date_raw[5:7] + '.' + date_raw[:4] if len(date_raw) >= 10 else '-',
+            'items_text': "\n".join(lines),
+            'item_lines': len(lines),
+            'total_text': f"{order.get('total', '0')} {order.get('currency', '')}",
+            'total': _money(order.get('total')),  # parsed here so the stats just add them up
+        }
+    return display
+
+
+def _prepare_orders(orders: list) -> list:
+    """Build the meta index and display texts of fetched orders on the worker thread"""
+    for order in orders:
+        _order_meta(order)
+        _order_display(order)
+    return orders
+
+
+class _ApiTask(QRunnable):
+    """One WooCommerce call run on the API thread pool; done() gets the result and emits it to the UI.
+    If the call raises, done() gets failed(error) instead so the tab never stays stuck loading."""
+
+    def __init__(self, call: Callable[[], Any], done: Callable[[Any], None],
+                 failed: Callable[[Exception], Any]):
+        super().__init__()
+        self.call = call
+        self.done = done
+        self.failed = failed
+
+    def run(self):
+        try:
+            result = self.call()
+        except Exception as e:
+            logger.error(f"API task failed: {e}")
+            result = self.failed(e)
+        self.done(result)
+
+
 class CustomerTab(QWidget):
     """A tab widget containing customer information and orders"""
 
-    def __init__(self, woo_client, signals, order_statuses=None, parent=None):
+    phone_changed = pyqtSignal(str, str)  # old, new phone_number; MainWindow routes results by it
+
+    SEARCH_DEBOUNCE_MS = 150
+    BANNER_MS = 3000
+    ROW_HEIGHT = 60  # orders table rows; taller only for orders with several item lines
+
+    def __init__(self, woo_client, signals, order_statuses=None, parent=None, api_pool: Optional[QThreadPool] = None):
         super().__init__(parent)
         self.woo_client = woo_client
         self.signals = signals
+        self.api_pool = api_pool or QThreadPool.globalInstance()
         self.current_orders = []
-        self.phone_number = ""
-        self.order_statuses = order_statuses or []
+        self._phone_number = ""
+        self.order_statuses = order_statuses or ()  # ((slug, name), ...) from _freeze_order_statuses
+        # slug -> position in the status dropdown / display name; shared, never mutated
+        (self._order_status_index, self._order_status_names,
+         self._order_status_labels, self._order_status_slugs) = _order_status_lookups(self.order_statuses)
         self.pending_status_updates = {}  # row -> {'col': col, 'prev_idx': idx, 'prev_status': status}
+        # The delegates only paint, so every dropdown in the tab shares them; the tab owns them
+        self._order_delegate = ColoredComboDelegate(ORDER_STATUS_COLORS, self)
+        self._call_delegate = CallStatusComboDelegate(CALL_STATUSES, self)
+        # Coalesce keystrokes so typing clears the results once, not per character
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_debounce.timeout.connect(self._do_search_input_update)
         self._setup_ui()
 
     def _create_card(self, title: str) -> tuple:
         """Create a card widget with title."""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-        """)
+        card.setStyleSheet(_CARD_QSS)
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 15, 20, 20)
         layout.setSpacing(12)
 
         title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title_label.setFont(_ui_font(14, bold=True))
         title_label.setStyleSheet("color: #333; border: none;")
         layout.addWidget(title_label)
 
@@ -1192,7 +2072,7 @@ class CustomerTab(QWidget):
     def _create_info_label(self, text: str, is_value: bool = False, size: int = 13) -> QLabel:
         """Create styled label."""
         label = QLabel(text)
-        label.setFont(QFont("Segoe UI", size, QFont.Weight.Bold if is_value else QFont.Weight.Normal))
+        label.setFont(_ui_font(size, bold=is_value))
         label.setStyleSheet(f"color: {'#333' if is_value else '#666'}; border: none;")
         label.setWordWrap(True)
         return label
@@ -1208,53 +2088,27 @@ class CustomerTab(QWidget):
 
         # Phone search
         phone_frame = QFrame()
-        phone_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-        """)
+        phone_frame.setStyleSheet(_CARD_QSS)
         phone_layout = QHBoxLayout(phone_frame)
         phone_layout.setContentsMargins(15, 10, 15, 10)
 
         phone_icon = QLabel("📞")
-        phone_icon.setFont(QFont("Segoe UI", 16))
+        phone_icon.setFont(_ui_font(16))
         phone_icon.setStyleSheet("border: none;")
         phone_layout.addWidget(phone_icon)
 
         self.phone_input = QLineEdit()
         self.phone_input.setPlaceholderText("Search by phone number...")
-        self.phone_input.setFont(QFont("Segoe UI", 14))
-        self.phone_input.setStyleSheet("""
-            QLineEdit {
-                border: none;
-                padding: 8px;
-                background: transparent;
-            }
-        """)
+        self.phone_input.setFont(_ui_font(14))
+        self.phone_input.setStyleSheet(_SEARCH_INPUT_QSS)
         self.phone_input.returnPressed.connect(self._search)
         self.phone_input.textChanged.connect(self._on_search_input_changed)
         phone_layout.addWidget(self.phone_input)
 
         self.search_btn = QPushButton("Search")
-        self.search_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.search_btn.setFont(_ui_font(12, bold=True))
         self.search_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.search_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #1557b0;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.search_btn.setStyleSheet(_BLUE_BUTTON_QSS)
         self.search_btn.clicked.connect(self._search)
         phone_layout.addWidget(self.search_btn)
 
@@ -1262,53 +2116,27 @@ class CustomerTab(QWidget):
 
         # Order number search
         order_frame = QFrame()
-        order_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-        """)
+        order_frame.setStyleSheet(_CARD_QSS)
         order_layout = QHBoxLayout(order_frame)
         order_layout.setContentsMargins(15, 10, 15, 10)
 
         order_icon = QLabel("#")
-        order_icon.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        order_icon.setFont(_ui_font(18, bold=True))
         order_icon.setStyleSheet("border: none; color: #7c3aed;")
         order_layout.addWidget(order_icon)
 
         self.order_input = QLineEdit()
         self.order_input.setPlaceholderText("Search by order number...")
-        self.order_input.setFont(QFont("Segoe UI", 14))
-        self.order_input.setStyleSheet("""
-            QLineEdit {
-                border: none;
-                padding: 8px;
-                background: transparent;
-            }
-        """)
+        self.order_input.setFont(_ui_font(14))
+        self.order_input.setStyleSheet(_SEARCH_INPUT_QSS)
         self.order_input.returnPressed.connect(self._search_order)
         self.order_input.textChanged.connect(self._on_search_input_changed)
         order_layout.addWidget(self.order_input)
 
         self.order_search_btn = QPushButton("Find Order")
-        self.order_search_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.order_search_btn.setFont(_ui_font(12, bold=True))
         self.order_search_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.order_search_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7c3aed;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #6d28d9;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.order_search_btn.setStyleSheet(_PURPLE_BUTTON_QSS)
         self.order_search_btn.clicked.connect(self._search_order)
         order_layout.addWidget(self.order_search_btn)
 
@@ -1316,6 +2144,17 @@ class CustomerTab(QWidget):
 
         main_layout.addLayout(search_container)
 
+        # "Not found" notice; shown inline instead of a modal box so calls keep coming in
+        self.status_banner = QLabel()
+        self.status_banner.setFont(_ui_font(12))
+        self.status_banner.setStyleSheet(_BANNER_QSS)
+        self.status_banner.hide()
+        main_layout.addWidget(self.status_banner)
+        self._banner_timer = QTimer(self)
+        self._banner_timer.setSingleShot(True)
+        self._banner_timer.setInterval(self.BANNER_MS)
+        self._banner_timer.timeout.connect(self.status_banner.hide)
+
         # ========== MAIN CONTENT ==========
         # Wrap content in a widget so overlay can be positioned over it
         self.content_widget = QWidget()
@@ -1332,7 +2171,7 @@ class CustomerTab(QWidget):
 
         # Customer name (large)
         self.customer_name = QLabel("No customer selected")
-        self.customer_name.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))
+        self.customer_name.setFont(_ui_font(22, bold=True))
         self.customer_name.setStyleSheet("color: #333; border: none;")
         self.customer_name.setWordWrap(True)
         customer_layout.addWidget(self.customer_name)
@@ -1371,7 +2210,7 @@ class CustomerTab(QWidget):
         orders_box = QVBoxLayout()
         orders_title = self._create_info_label("Total Orders")
         self.total_orders = QLabel("-")
-        self.total_orders.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
+        self.total_orders.setFont(_ui_font(32, bold=True))
         self.total_orders.setStyleSheet("color: #1a73e8; border: none;")
         orders_box.addWidget(orders_title)
         orders_box.addWidget(self.total_orders)
@@ -1381,7 +2220,7 @@ class CustomerTab(QWidget):
         spent_box = QVBoxLayout()
         spent_title = self._create_info_label("Total Spent")
         self.total_spent = QLabel("-")
-        self.total_spent.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
+        self.total_spent.setFont(_ui_font(32, bold=True))
         self.total_spent.setStyleSheet("color: #34a853; border: none;")
         spent_box.addWidget(spent_title)
         spent_box.addWidget(self.total_spent)
@@ -1396,24 +2235,10 @@ class CustomerTab(QWidget):
         btn_layout = QHBoxLayout()
 
         self.open_btn = QPushButton("Open in WooCommerce")
-        self.open_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.open_btn.setFont(_ui_font(12, bold=True))
         self.open_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.open_btn.setEnabled(False)
-        self.open_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7c3aed;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 15px 20px;
-            }
-            QPushButton:hover {
-                background-color: #6d28d9;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.open_btn.setStyleSheet(_OPEN_BUTTON_QSS)
         self.open_btn.clicked.connect(self._open_woocommerce)
         btn_layout.addWidget(self.open_btn)
 
@@ -1428,31 +2253,8 @@ class CustomerTab(QWidget):
         self.orders_table = QTableWidget()
         self.orders_table.setColumnCount(8)
         self.orders_table.setHorizontalHeaderLabels(["Order #", "Date", "Status", "Call Status", "Items", "Total", "", ""])
-        self.orders_table.setFont(QFont("Segoe UI", 14))
-        self.orders_table.setStyleSheet("""
-            QTableWidget {
-                border: none;
-                background-color: white;
-                gridline-color: #f0f0f0;
-            }
-            QTableWidget::item {
-                padding: 12px;
-                border-bottom: 1px solid #f0f0f0;
-            }
-            QTableWidget::item:selected {
-                background-color: #e8f0fe;
-                color: #333;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                color: #666;
-                font-weight: 600;
-                font-size: 12px;
-                border: none;
-                border-bottom: 2px solid #e0e0e0;
-                padding: 12px 8px;
-            }
-        """)
+        self.orders_table.setFont(_ui_font(14))
+        self.orders_table.setStyleSheet(_ORDERS_TABLE_QSS)
 
         header = self.orders_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)  # Order #
@@ -1471,8 +2273,11 @@ class CustomerTab(QWidget):
         self.orders_table.setColumnWidth(5, 100)   # Total
         self.orders_table.setColumnWidth(6, 80)    # Open button
         self.orders_table.setColumnWidth(7, 80)    # Odoo button
+        self.orders_table.setItemDelegateForColumn(6, RowButtonDelegate('#6c757d', '#5a6268', self.orders_table))
+        self.orders_table.setItemDelegateForColumn(7, RowButtonDelegate('#714B67', '#5a3d52', self.orders_table))
 
         self.orders_table.verticalHeader().setVisible(False)
+        self.orders_table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
         self.orders_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.orders_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
         self.orders_table.setAlternatingRowColors(True)
@@ -1485,6 +2290,7 @@ class CustomerTab(QWidget):
 
         # Connect row selection change to update customer info
         self.orders_table.currentCellChanged.connect(self._on_order_selected)
+        self.orders_table.cellClicked.connect(self._on_cell_clicked)
 
         # Add content widget to main layout
         main_layout.addWidget(self.content_widget, 1)
@@ -1507,32 +2313,35 @@ class CustomerTab(QWidget):
         if not phone:
             return
 
+        self._search_debounce.stop()  # a pending clear must not wipe the new results
         self.phone_number = phone
         self.search_btn.setEnabled(False)
         self.search_btn.setText("Searching...")
         self._show_loading()
 
-        def search_thread():
-            orders = self.woo_client.search_orders_by_phone(phone)
-            self.signals.search_result.emit(orders, phone)
-
-        threading.Thread(target=search_thread, daemon=True).start()
+        self.api_pool.start(_ApiTask(
+            lambda: _prepare_orders(self.woo_client.search_orders_by_phone(phone)),
+            lambda orders: self.signals.search_result.emit(orders, phone),
+            lambda e: []
+        ))
 
     def _search_order(self):
         order_num = self.order_input.text().strip()
         if not order_num:
             return
 
+        self._search_debounce.stop()
         self.phone_number = f"order:{order_num}"  # Use special prefix for order search
         self.order_search_btn.setEnabled(False)
         self.order_search_btn.setText("Searching...")
         self._show_loading()
 
-        def search_thread():
-            orders = self.woo_client.get_order_by_number(order_num)
-            self.signals.search_result.emit(orders, f"order:{order_num}")
-
-        threading.Thread(target=search_thread, daemon=True).start()
+        key = self.phone_number
+        self.api_pool.start(_ApiTask(
+            lambda: _prepare_orders(self.woo_client.get_order_by_number(order_num)),
+            lambda orders: self.signals.search_result.emit(orders, key),
+            lambda e: []
+        ))
 
     def search_phone(self, phone: str):
         """External method to search for a phone number"""
@@ -1561,273 +2370,175 @@ class CustomerTab(QWidget):
             # Show appropriate message based on search type
             if phone.startswith("order:"):
                 order_num = phone[6:]
-                QMessageBox.information(self, "Not Found", f"No order found with number: #{order_num}")
+                self._show_banner(f"No order found with number: #{order_num}")
             else:
-                QMessageBox.information(self, "Not Found", f"No orders found for: {phone}")
+                self._show_banner(f"No orders found for: {phone}")
             return
 
+        self.status_banner.hide()
+
         # Customer info
         first_order = orders[0]
-        billing = first_order.get('billing', {})
-
-        name = f"{billing.get('first_name', '')} {billing.get('last_name', '')}".strip()
-        self.customer_name.setText(name or "Unknown")
-
-        self.info_labels['phone'].setText(billing.get('phone', '-'))
-        self.info_labels['email'].setText(billing.get('email', '-'))
-        self.info_labels['city'].setText(f"{billing.get('city', '')} {billing.get('country', '')}")
-
-        address = f"{billing.get('address_1', '')} {billing.get('address_2', '')}".strip()
-        self.info_labels['address'].setText(address or '-')
+        self._show_customer(_order_display(first_order))
 
         # Stats
         currency = first_order.get('currency', 'BGN')
-        total_spent = sum(float(o.get('total', 0)) for o in orders)
+        total_spent = sum(_order_display(o)['total'] for o in orders)
         self.total_orders.setText(str(len(orders)))
         self.total_spent.setText(f"{total_spent:.2f} {currency}")
 
-        # Orders table
+        # Orders table - fill it with painting and signals off so it is laid out once
+        self.orders_table.setUpdatesEnabled(False)
+        self.orders_table.blockSignals(True)
+        self.orders_table.setRowCount(0)  # drop dropdowns and buttons left over from the previous result
         self.orders_table.setRowCount(len(orders))
         for i, order in enumerate(orders):
+            display = _order_display(order)
+
             # Order number (with shop indicator if multi-shop)
-            order_num = order.get('number', '')
             shop_name = order.get('_shop_name', '')
-            shop_color = order.get('_shop_color', '#7c3aed')
+            num_item = QTableWidgetItem(display['num_text'])
+            num_item.setFont(_ui_font(12, bold=True))
             if shop_name:
-                # Show shop initial as colored badge
-                shop_initial = shop_name[0].upper() if shop_name else 'S'
-                num_text = f"[{shop_initial}] #{order_num}"
-            else:
-                num_text = f"#{order_num}"
-            num_item = QTableWidgetItem(num_text)
-            num_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-            if shop_name:
-                num_item.setForeground(QColor(shop_color))
+                num_item.setForeground(_brush(order.get('_shop_color', '#7c3aed')))
                 num_item.setToolTip(f"Shop: {shop_name}")
             self.orders_table.setItem(i, 0, num_item)
 
-            # Date - format as dd.mm.yyyy
-            date_raw = order.get('date_created', '')
-            if date_raw:
-                date = f"{date_raw[8:10]}.{date_raw[5:7]}.{date_raw[:4]}"
-            else:
-                date = '-'
-            self.orders_table.setItem(i, 1, QTableWidgetItem(date))
+            self.orders_table.setItem(i, 1, QTableWidgetItem(display['date']))
 
-            # Status dropdown
+            # Status - a plain colored cell; the dropdown is only built when it is clicked
             current_status = order.get('status', '')
-            status_combo = QComboBox()
-            status_combo.setFont(QFont("Segoe UI", 14))
-
-            # Add statuses from API with colors
-            current_index = 0
-            for idx, st in enumerate(self.order_statuses):
-                status_combo.addItem(st['name'], st['slug'])
-                if st['slug'] == current_status:
-                    current_index = idx
-
-            status_combo.setCurrentIndex(current_index)
-
-            # Apply custom delegate for colored items in dropdown
-            order_status_delegate = ColoredComboDelegate(ORDER_STATUS_COLORS, status_combo)
-            status_combo.setItemDelegate(order_status_delegate)
-
-            # Get color for current status
             order_color = ORDER_STATUS_COLORS.get(current_status, '#6c757d')
-            hover_bg = lighten_color(order_color, 0.7)
-
-            # Style the main combo button
-            status_combo.setStyleSheet(f"""
-                QComboBox {{
-                    font-weight: bold;
-                    font-size: 14px;
-                    border: 2px solid {order_color};
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    background-color: white;
-                    color: {order_color};
-                }}
-                QComboBox:hover {{
-                    background-color: {hover_bg};
-                    border-color: {order_color};
-                }}
-                QComboBox::drop-down {{
-                    border: none;
-                    width: 25px;
-                }}
-                QComboBox QAbstractItemView {{
-                    font-size: 14px;
-                    padding: 0px;
-                    background-color: white;
-                    outline: none;
-                }}
-            """)
-
-            # Connect to change handler
-            order_id = order.get('id')
-            row = i
-            status_combo.currentIndexChanged.connect(
-                lambda idx, oid=order_id, r=row, combo=status_combo: self._on_order_status_changed(oid, r, combo)
-            )
+            status_text = self._order_status_names.get(current_status, current_status)
+            self.orders_table.setItem(i, 2, self._status_item(status_text, order_color))
 
-            self.orders_table.setCellWidget(i, 2, status_combo)
-
-            # ElevenLabs Call Status from meta_data - as dropdown
-            call_status = ""
-            meta_data = order.get('meta_data', [])
-            for meta in meta_data:
-                if meta.get('key') == 'ElevenLabs_Call_Status':
-                    call_status = meta.get('value', '')
-                    break
-
-            # Create dropdown for call status
-            call_combo = QComboBox()
-            call_combo.setFont(QFont("Segoe UI", 14))
-
-            # Add all status options with icons and colors
-            current_index = 0
-            for idx, (key, info) in enumerate(CALL_STATUSES.items()):
-                display_text = f"{info['icon']} {info['text']}"
-                call_combo.addItem(display_text, key)
-                if key == call_status:
-                    current_index = idx
-
-            call_combo.setCurrentIndex(current_index)
-
-            # Apply custom delegate for colored items in dropdown
-            call_status_delegate = CallStatusComboDelegate(CALL_STATUSES, call_combo)
-            call_combo.setItemDelegate(call_status_delegate)
-
-            # Style based on current status
-            call_color = CALL_STATUSES.get(call_status, {}).get('color', '#6c757d')
-            call_hover_bg = lighten_color(call_color, 0.7)
-
-            call_combo.setStyleSheet(f"""
-                QComboBox {{
-                    color: {call_color};
-                    font-weight: bold;
-                    font-size: 14px;
-                    border: 2px solid {call_color};
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    background-color: white;
-                }}
-                QComboBox:hover {{
-                    background-color: {call_hover_bg};
-                    border-color: {call_color};
-                }}
-                QComboBox::drop-down {{
-                    border: none;
-                    width: 25px;
-                }}
-                QComboBox QAbstractItemView {{
-                    font-size: 14px;
-                    padding: 0px;
-                    background-color: white;
-                    outline: none;
-                }}
-            """)
-
-            # Connect to change handler
-            order_id = order.get('id')
-            row = i
-            call_combo.currentIndexChanged.connect(
-                lambda idx, oid=order_id, r=row, combo=call_combo: self._on_call_status_changed(oid, r, combo)
-            )
-
-            self.orders_table.setCellWidget(i, 3, call_combo)
+            # ElevenLabs Call Status from meta_data
+            meta = _order_meta(order)
+            call_status = meta.get('ElevenLabs_Call_Status', '')
+            call_info = CALL_STATUSES.get(call_status, CALL_STATUSES['Без_обаждане'])  # the dropdown's first entry
+            self.orders_table.setItem(i, 3, self._status_item(f"{call_info['icon']} {call_info['text']}", call_info['color']))
 
             # Items - show products, shipping, and fee lines
-            all_items = []
-
-            # Product lines - full format with SKU first
-            for item in order.get('line_items', []):
-                name = item.get('name', '')
-                sku = item.get('sku', '')
-                sku_text = f"[{sku}] " if sku else ""
-                qty = item.get('quantity', 1)
-                all_items.append(f"{sku_text}{name} x{qty}")
-
-            # Shipping lines
-            for shipping in order.get('shipping_lines', []):
-                method = shipping.get('method_title', '') or shipping.get('method_id', 'Ship')
-                total = shipping.get('total', '')
-                if total and float(total) > 0:
-                    all_items.append(f"🚚 {method}")
-
-            # Fee lines
-            for fee in order.get('fee_lines', []):
-                fee_name = fee.get('name', 'Fee')
-                all_items.append(f"⚙ {fee_name}")
-
-            items_text = "\n".join(all_items)
-            items_item = QTableWidgetItem(items_text)
-            items_item.setToolTip(items_text)
+            items_item = QTableWidgetItem(display['items_text'])
+            items_item.setToolTip(display['items_text'])
             self.orders_table.setItem(i, 4, items_item)
 
             # Total
-            total = f"{order.get('total', '0')} {order.get('currency', '')}"
-            total_item = QTableWidgetItem(total)
-            total_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+            total_item = QTableWidgetItem(display['total_text'])
+            total_item.setFont(_ui_font(12, bold=True))
             self.orders_table.setItem(i, 5, total_item)
 
-            # Open button
-            open_btn = QPushButton("Open")
-            open_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c757d;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                }
-            """)
-            open_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            order_id = order.get('id')
-            open_btn.clicked.connect(lambda checked, oid=order_id: self._open_order(oid))
-            self.orders_table.setCellWidget(i, 6, open_btn)
+            # Open button - painted by RowButtonDelegate, handled in _on_cell_clicked
+            self.orders_table.setItem(i, 6, QTableWidgetItem("Open"))
 
             # Odoo button - only if _odoo_order_id exists in meta_data
-            odoo_order_id = None
-            for meta in meta_data:
-                if meta.get('key') == '_odoo_order_id':
-                    odoo_order_id = meta.get('value')
-                    break
-
+            odoo_order_id = meta.get('_odoo_order_id')
             if odoo_order_id:
                 # Get odoo_url from shop config
                 shop_odoo_url = order.get('_shop_odoo_url', '')
                 if shop_odoo_url:
-                    odoo_btn = QPushButton("Odoo")
-                    odoo_btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #714B67;
-                            color: white;
-                            border: none;
-                            border-radius: 4px;
-                            padding: 6px 12px;
-                            font-size: 11px;
-                        }
-                        QPushButton:hover {
-                            background-color: #5a3d52;
-                        }
-                    """)
-                    odoo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                    odoo_url = f"{shop_odoo_url}/{odoo_order_id}"
-                    odoo_btn.clicked.connect(lambda checked, url=odoo_url: webbrowser.open(url))
-                    self.orders_table.setCellWidget(i, 7, odoo_btn)
-
-            # Auto row height based on all items
-            row_height = max(60, 25 * len(all_items) + 20)
-            self.orders_table.setRowHeight(i, row_height)
+                    odoo_item = QTableWidgetItem("Odoo")
+                    odoo_item.setData(Qt.ItemDataRole.UserRole, f"{shop_odoo_url}/{odoo_order_id}")
+                    self.orders_table.setItem(i, 7, odoo_item)
+
+            # Auto row height based on all items; most orders fit the default height
+            row_height = 25 * display['item_lines'] + 20
+            if row_height > self.ROW_HEIGHT:
+                self.orders_table.setRowHeight(i, row_height)
+
+        self.orders_table.blockSignals(False)
+        self.orders_table.setUpdatesEnabled(True)
 
         self.open_btn.setEnabled(True)
         self.orders_table.selectRow(0)
 
+    def _status_item(self, text: str, color: str) -> QTableWidgetItem:
+        """Read-only status cell, swapped for a dropdown by _on_cell_clicked"""
+        item = QTableWidgetItem(text)
+        item.setFont(_ui_font(14, bold=True))
+        item.setForeground(_brush(color))
+        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        item.setToolTip("Click to change")
+        return item
+
+    def _on_cell_clicked(self, row: int, col: int):
+        """Open the order for the button cells; turn a status cell into its dropdown the first time it is clicked"""
+        if row >= len(self.current_orders):
+            return
+
+        if col == 6:
+            order = self.current_orders[row]
+            self._open_order(order.get('id'), order.get('_shop_name'))
+            return
+        if col == 7:
+            odoo_item = self.orders_table.item(row, 7)
+            if odoo_item:
+                webbrowser.open(odoo_item.data(Qt.ItemDataRole.UserRole))
+            return
+
+        if col not in (2, 3) or self.orders_table.cellWidget(row, col):
+            return
+
+        if col == 2:
+            combo = self._create_order_status_combo(row)
+        else:
+            combo = self._create_call_status_combo(row)
+        self.orders_table.setCellWidget(row, col, combo)
+        combo.showPopup()
+
+    def _create_order_status_combo(self, row: int) -> QComboBox:
+        """Order status dropdown for a row, wired to _on_order_status_changed"""
+        order = self.current_orders[row]
+        current_status = order.get('status', '')
+        status_combo = QComboBox()
+        status_combo.setFont(_ui_font(14))
+
+        # Add statuses from API in one insert, then tag each with its slug
+        status_combo.addItems(self._order_status_labels)
+        for idx, slug in enumerate(self._order_status_slugs):
+            status_combo.setItemData(idx, slug)
+
+        status_combo.setCurrentIndex(self._order_status_index.get(current_status, 0))
+
+        # Apply custom delegate for colored items in dropdown
+        status_combo.setItemDelegate(self._order_delegate)
+
+        status_combo.setStyleSheet(_ORDER_COMBO_QSS.get(current_status, _DEFAULT_COMBO_QSS))
+
+        # Connect to change handler (PyQt drops the index argument the handler doesn't take)
+        status_combo.currentIndexChanged.connect(
+            functools.partial(self._on_order_status_changed, order.get('id'), row, status_combo)
+        )
+
+        return status_combo
+
+    def _create_call_status_combo(self, row: int) -> QComboBox:
+        """Call status dropdown for a row, wired to _on_call_status_changed"""
+        order = self.current_orders[row]
+        call_status = _order_meta(order).get('ElevenLabs_Call_Status', '')
+
+        call_combo = QComboBox()
+        call_combo.setFont(_ui_font(14))
+
+        # Add all status options with icons, tagged with their keys
+        call_combo.addItems(_CALL_STATUS_LABELS)
+        for idx, key in enumerate(CALL_STATUSES):
+            call_combo.setItemData(idx, key)
+
+        call_combo.setCurrentIndex(_CALL_STATUS_INDEX.get(call_status, 0))
+
+        # Apply custom delegate for colored items in dropdown
+        call_combo.setItemDelegate(self._call_delegate)
+
+        call_combo.setStyleSheet(_CALL_COMBO_QSS.get(call_status, _DEFAULT_COMBO_QSS))
+
+        # Connect to change handler
+        call_combo.currentIndexChanged.connect(
+            functools.partial(self._on_call_status_changed, order.get('id'), row, call_combo)
+        )
+
+        return call_combo
+
     def _clear_results(self):
         self.customer_name.setText("No customer selected")
         for key in self.info_labels:
@@ -1838,36 +2549,30 @@ class CustomerTab(QWidget):
         self.open_btn.setEnabled(False)
         self.current_orders = []
 
-    def _open_order(self, order_id: int):
+    def _open_order(self, order_id: int, shop_name: Optional[str] = None):
         if order_id:
-            url = self.woo_client.get_order_url(order_id)
+            url = self.woo_client.get_order_url(order_id, shop_name)
             webbrowser.open(url)
 
     def _open_woocommerce(self):
         selected = self.orders_table.currentRow()
         if selected >= 0 and selected < len(self.current_orders):
-            order_id = self.current_orders[selected].get('id')
-            self._open_order(order_id)
+            order = self.current_orders[selected]
+            self._open_order(order.get('id'), order.get('_shop_name'))
 
     def _on_order_selected(self, row: int, col: int, prev_row: int, prev_col: int):
         """Update customer info when a different order row is selected"""
         if row < 0 or row >= len(self.current_orders):
             return
 
-        order = self.current_orders[row]
-        billing = order.get('billing', {})
-
-        # Update customer name
-        name = f"{billing.get('first_name', '')} {billing.get('last_name', '')}".strip()
-        self.customer_name.setText(name or "Unknown")
-
-        # Update customer info labels
-        self.info_labels['phone'].setText(billing.get('phone', '-'))
-        self.info_labels['email'].setText(billing.get('email', '-'))
-        self.info_labels['city'].setText(f"{billing.get('city', '')} {billing.get('country', '')}")
+        self._show_customer(_order_display(self.current_orders[row]))
 
-        address = f"{billing.get('address_1', '')} {billing.get('address_2', '')}".strip()
-        self.info_labels['address'].setText(address or '-')
+    def _show_customer(self, display: dict):
+        self.customer_name.setText(display['name'])
+        self.info_labels['phone'].setText(display['phone'])
+        self.info_labels['email'].setText(display['email'])
+        self.info_labels['city'].setText(display['city'])
+        self.info_labels['address'].setText(display['address'])
 
     def _on_order_status_changed(self, order_id: int, row: int, combo: QComboBox):
         """Handle order status dropdown change"""
@@ -1886,71 +2591,27 @@ class CustomerTab(QWidget):
         }
 
         # Update combo color immediately
-        order_color = ORDER_STATUS_COLORS.get(new_status, '#6c757d')
-        hover_bg = lighten_color(order_color, 0.7)
-        combo.setStyleSheet(f"""
-            QComboBox {{
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid {order_color};
-                border-radius: 6px;
-                padding: 6px 10px;
-                background-color: white;
-                color: {order_color};
-            }}
-            QComboBox:hover {{
-                background-color: {hover_bg};
-                border-color: {order_color};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 25px;
-            }}
-            QComboBox QAbstractItemView {{
-                font-size: 14px;
-                padding: 5px;
-                background-color: white;
-                color: #333;
-                selection-background-color: {order_color};
-                selection-color: white;
-            }}
-            QComboBox QAbstractItemView::item {{
-                padding: 6px;
-                color: #333;
-                background-color: white;
-            }}
-            QComboBox QAbstractItemView::item:hover {{
-                background-color: {hover_bg};
-                color: #333;
-            }}
-            QComboBox QAbstractItemView::item:selected {{
-                background-color: {order_color};
-                color: white;
-            }}
-        """)
+        combo.setStyleSheet(_ORDER_COMBO_QSS.get(new_status, _DEFAULT_COMBO_QSS))
 
         # Disable combo while updating
         combo.setEnabled(False)
 
-        # Update via API in background thread
-        def update_thread():
-            success, message = self.woo_client.update_order_status(order_id, new_status)
-            self.signals.status_update_result.emit(row, success, message)
-
-        threading.Thread(target=update_thread, daemon=True).start()
+        # Update via API on the worker pool
+        shop_name = self.current_orders[row].get('_shop_name') if row < len(self.current_orders) else None
+        self.api_pool.start(_ApiTask(
+            lambda: self.woo_client.update_order_status(order_id, new_status, shop_name),
+            lambda result: self.signals.status_update_result.emit(row, *result),
+            lambda e: (False, str(e))
+        ))
 
     def _on_call_status_changed(self, order_id: int, row: int, combo: QComboBox):
         """Handle call status dropdown change"""
         new_status = combo.currentData()
-        status_info = CALL_STATUSES.get(new_status, {})
 
         # Get previous call status from order meta_data
         prev_status = ""
         if row < len(self.current_orders):
-            for meta in self.current_orders[row].get('meta_data', []):
-                if meta.get('key') == '_call_status':
-                    prev_status = meta.get('value', '')
-                    break
+            prev_status = _order_meta(self.current_orders[row]).get('ElevenLabs_Call_Status', '')
 
         # Store pending update info for potential revert
         self.pending_status_updates[row] = {
@@ -1960,58 +2621,18 @@ class CustomerTab(QWidget):
         }
 
         # Update combo color immediately
-        call_color = status_info.get('color', '#6c757d')
-        call_hover_bg = lighten_color(call_color, 0.7)
-        combo.setStyleSheet(f"""
-            QComboBox {{
-                color: {call_color};
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid {call_color};
-                border-radius: 6px;
-                padding: 6px 10px;
-                background-color: white;
-            }}
-            QComboBox:hover {{
-                background-color: {call_hover_bg};
-                border-color: {call_color};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 25px;
-            }}
-            QComboBox QAbstractItemView {{
-                font-size: 14px;
-                padding: 5px;
-                background-color: white;
-                color: #333;
-                selection-background-color: {call_color};
-                selection-color: white;
-            }}
-            QComboBox QAbstractItemView::item {{
-                padding: 6px;
-                color: #333;
-                background-color: white;
-            }}
-            QComboBox QAbstractItemView::item:hover {{
-                background-color: {call_hover_bg};
-                color: #333;
-            }}
-            QComboBox QAbstractItemView::item:selected {{
-                background-color: {call_color};
-                color: white;
-            }}
-        """)
+        combo.setStyleSheet(_CALL_COMBO_QSS.get(new_status, _DEFAULT_COMBO_QSS))
 
         # Disable combo while updating
         combo.setEnabled(False)
 
-        # Update via API in background thread
-        def update_thread():
-            success, message = self.woo_client.update_call_status(order_id, new_status)
-            self.signals.status_update_result.emit(row, success, message)
-
-        threading.Thread(target=update_thread, daemon=True).start()
+        # Update via API on the worker pool
+        shop_name = self.current_orders[row].get('_shop_name') if row < len(self.current_orders) else None
+        self.api_pool.start(_ApiTask(
+            lambda: self.woo_client.update_call_status(order_id, new_status, shop_name),
+            lambda result: self.signals.status_update_result.emit(row, *result),
+            lambda e: (False, str(e))
+        ))
 
     def on_status_update_result(self, row: int, success: bool, message: str):
         """Handle the result of status update API call"""
@@ -2037,18 +2658,7 @@ class CustomerTab(QWidget):
                     # Call status - update meta_data
                     combo = self.orders_table.cellWidget(row, 3)
                     if combo:
-                        new_call_status = combo.currentData()
-                        found = False
-                        for meta in self.current_orders[row].get('meta_data', []):
-                            if meta.get('key') == '_call_status':
-                                meta['value'] = new_call_status
-                                found = True
-                                break
-                        if not found:
-                            self.current_orders[row].setdefault('meta_data', []).append({
-                                'key': '_call_status',
-                                'value': new_call_status
-                            })
+                        _order_meta(self.current_orders[row])['ElevenLabs_Call_Status'] = combo.currentData()
         else:
             # Revert combo to previous value on failure
             if pending:
@@ -2060,98 +2670,38 @@ class CustomerTab(QWidget):
                     prev_status = pending['prev_status']
                     if pending['col'] == 2:
                         # Order status
-                        order_color = ORDER_STATUS_COLORS.get(prev_status, '#6c757d')
-                        hover_bg = lighten_color(order_color, 0.7)
-                        combo.setStyleSheet(f"""
-                            QComboBox {{
-                                font-weight: bold;
-                                font-size: 14px;
-                                border: 2px solid {order_color};
-                                border-radius: 6px;
-                                padding: 6px 10px;
-                                background-color: white;
-                                color: {order_color};
-                            }}
-                            QComboBox:hover {{
-                                background-color: {hover_bg};
-                                border-color: {order_color};
-                            }}
-                            QComboBox::drop-down {{
-                                border: none;
-                                width: 25px;
-                            }}
-                            QComboBox QAbstractItemView {{
-                                font-size: 14px;
-                                padding: 5px;
-                                background-color: white;
-                                color: #333;
-                                selection-background-color: {order_color};
-                                selection-color: white;
-                            }}
-                            QComboBox QAbstractItemView::item {{
-                                padding: 6px;
-                                color: #333;
-                                background-color: white;
-                            }}
-                            QComboBox QAbstractItemView::item:hover {{
-                                background-color: {hover_bg};
-                                color: #333;
-                            }}
-                            QComboBox QAbstractItemView::item:selected {{
-                                background-color: {order_color};
-                                color: white;
-                            }}
-                        """)
+                        combo.setStyleSheet(_ORDER_COMBO_QSS.get(prev_status, _DEFAULT_COMBO_QSS))
                     else:
                         # Call status
-                        call_color = CALL_STATUSES.get(prev_status, {}).get('color', '#6c757d')
-                        call_hover_bg = lighten_color(call_color, 0.7)
-                        combo.setStyleSheet(f"""
-                            QComboBox {{
-                                color: {call_color};
-                                font-weight: bold;
-                                font-size: 14px;
-                                border: 2px solid {call_color};
-                                border-radius: 6px;
-                                padding: 6px 10px;
-                                background-color: white;
-                            }}
-                            QComboBox:hover {{
-                                background-color: {call_hover_bg};
-                                border-color: {call_color};
-                            }}
-                            QComboBox::drop-down {{
-                                border: none;
-                                width: 25px;
-                            }}
-                            QComboBox QAbstractItemView {{
-                                font-size: 14px;
-                                padding: 5px;
-                                background-color: white;
-                                color: #333;
-                                selection-background-color: {call_color};
-                                selection-color: white;
-                            }}
-                            QComboBox QAbstractItemView::item {{
-                                padding: 6px;
-                                color: #333;
-                                background-color: white;
-                            }}
-                            QComboBox QAbstractItemView::item:hover {{
-                                background-color: {call_hover_bg};
-                                color: #333;
-                            }}
-                            QComboBox QAbstractItemView::item:selected {{
-                                background-color: {call_color};
-                                color: white;
-                            }}
-                        """)
+                        combo.setStyleSheet(_CALL_COMBO_QSS.get(prev_status, _DEFAULT_COMBO_QSS))
                     combo.blockSignals(False)
             QMessageBox.warning(self, "Update Failed", f"Failed to update status:\n{message}")
 
     def _on_search_input_changed(self, text: str):
         """Hide results when user starts typing in search fields"""
-        self._clear_results()
+        self._search_debounce.start()
+
+    def _do_search_input_update(self):
+        self.status_banner.hide()
+        if self.orders_table.rowCount():  # nothing to clear after the first keystroke
+            self._clear_results()
+
+    def _show_banner(self, text: str):
+        self.status_banner.setText(text)
+        self.status_banner.show()
+        self._banner_timer.start()  # restarts if a previous notice is still up
+
+    @property
+    def phone_number(self) -> str:
+        """Phone (or "order:<number>") whose search results this tab shows"""
+        return self._phone_number
+
+    @phone_number.setter
+    def phone_number(self, phone: str):
+        old = self._phone_number
+        if phone != old:
+            self._phone_number = phone
+            self.phone_changed.emit(old, phone)
 
     def get_customer_name(self) -> str:
         """Return customer name for tab title"""
@@ -2161,42 +2711,180 @@ class CustomerTab(QWidget):
         return self.phone_number[:15] if self.phone_number else "New"
 
 
+_MAIN_WINDOW_QSS = """
+    QMainWindow, QWidget {
+        background-color: #f5f5f5;
+        font-family: "Segoe UI", "SF Pro Display", Arial, sans-serif;
+    }
+"""
+_LOGO_QSS = """
+    background-color: #7c3aed;
+    color: white;
+    border-radius: 8px;
+    padding: 4px 12px;
+"""
+_UPDATE_BTN_QSS = """
+    QPushButton {
+        background-color: #28a745;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 15px;
+    }
+    QPushButton:hover {
+        background-color: #218838;
+    }
+"""
+_CHECK_UPDATE_BTN_QSS = """
+    QPushButton {
+        background-color: #e0e0e0;
+        color: #333;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #d0d0d0;
+    }
+    QPushButton:disabled {
+        background-color: #f0f0f0;
+        color: #999;
+    }
+"""
+# Both connection states in one sheet; _update_status only flips the "state" property
+_STATUS_FRAME_QSS = """
+    QFrame#statusFrame {
+        background-color: #fff3cd;
+        border: 1px solid #ffc107;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QFrame#statusFrame[state="connected"] {
+        background-color: #d4edda;
+        border: 1px solid #28a745;
+    }
+    QFrame#statusFrame QLabel {
+        color: #856404;
+        border: none;
+    }
+    QFrame#statusFrame[state="connected"] QLabel {
+        color: #155724;
+    }
+"""
+_TAB_WIDGET_QSS = """
+    QTabWidget::pane {
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        background: #f5f5f5;
+    }
+    QTabBar::tab {
+        background: #e0e0e0;
+        color: #333;
+        padding: 10px 20px;
+        margin-right: 4px;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QTabBar::tab:selected {
+        background: white;
+        border: 1px solid #e0e0e0;
+        border-bottom: none;
+    }
+    QTabBar::tab:hover:!selected {
+        background: #d0d0d0;
+    }
+"""
+_NEW_TAB_BTN_QSS = """
+    QPushButton {
+        background-color: #1a73e8;
+        color: white;
+        border: none;
+        border-radius: 15px;
+    }
+    QPushButton:hover {
+        background-color: #1557b0;
+    }
+"""
+
+
+class _TabPlaceholder(QWidget):
+    """Stands in for a CustomerTab that has not been shown yet"""
+
+    def __init__(self, phone: Optional[str] = None):
+        super().__init__()
+        self.phone = phone  # searched once the real tab is built
+
+
 class MainWindow(QMainWindow):
+    _cached_icon: Optional[QIcon] = None
+    _cached_phone_icon: Optional[QIcon] = None
+    AMI_STOP_TIMEOUT_MS = 2000  # closing the window never waits longer on the AMI thread
+
     def __init__(self):
         super().__init__()
         self.config = Config()
         self.woo_client = MultiShopClient(self.config)
         self.signals = SignalEmitter()
         self.ami: Optional[AsteriskAMI] = None
+        self._ami_thread: Optional[QThread] = None
         self.webhook_server: Optional[WebhookServer] = None
+        # Searches and status updates from all tabs; a few at a time so WooCommerce doesn't throttle us
+        self.api_pool = QThreadPool(self)
+        self.api_pool.setMaxThreadCount(4)
         self.tab_counter = 0
-        self.order_statuses = self.woo_client.get_order_statuses()
+        self._phone_to_tabs: Dict[str, set] = {}  # phone_number -> CustomerTabs showing it
+        self._customer_tabs: set = set()  # built CustomerTabs; placeholders are not in here
+        # Calls that arrive together (a queue ringing several desks) are opened in one batch
+        self._pending_calls: deque = deque()
+        self._incoming_call_timer = QTimer(self)
+        self._incoming_call_timer.setSingleShot(True)
+        self._incoming_call_timer.setInterval(0)
+        self._incoming_call_timer.timeout.connect(self._flush_pending_calls)
+        self.order_statuses = _freeze_order_statuses(self.woo_client.get_order_statuses())
+
+        # One checker reused for every check; autoDelete off so the pool leaves it alive
+        self.update_checker = UpdateChecker()
+        self.update_checker.setAutoDelete(False)
+        self.update_checker.signals.update_available.connect(self._on_update_available)
+        self.update_checker.signals.no_update.connect(self._on_no_update)
+        self.update_checker.signals.error.connect(self._on_update_error)
 
         self.setWindowTitle("Martinez Orders")
         self.setMinimumSize(1400, 900)
         self.resize(1800, 1000)
 
         # Set window/taskbar icon - purple "M" matching the app logo
-        self.setWindowIcon(self._create_app_icon())
+        self.setWindowIcon(self._app_icon())
 
         # Light professional theme
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #f5f5f5;
-                font-family: "Segoe UI", "SF Pro Display", Arial, sans-serif;
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
 
-        self.signals.incoming_call.connect(self._on_incoming_call)
-        self.signals.connection_status.connect(self._update_status)
+        # Emitted from the AMI/webhook threads; queued so emit() only posts an
+        # event and the network threads never wait on the GUI
+        self.signals.incoming_call.connect(self._on_incoming_call, Qt.ConnectionType.QueuedConnection)
+        self.signals.connection_status.connect(self._update_status, Qt.ConnectionType.QueuedConnection)
         self.signals.search_result.connect(self._on_search_result)
         self.signals.status_update_result.connect(self._on_status_update_result)
 
         self._setup_ui()
-        self._connect_ami()
-        self._start_webhook_server()
-
-    def _create_app_icon(self) -> QIcon:
+        # Network setup waits for the event loop so the window paints first
+        QTimer.singleShot(0, self._connect_ami)
+        QTimer.singleShot(0, self._start_webhook_server)
+        # Quiet check: only shows the update button, and a release cached within
+        # UPDATE_CACHE_TTL is used without asking GitHub
+        QTimer.singleShot(0, functools.partial(self._check_for_updates, silent=True))
+
+    @classmethod
+    def _app_icon(cls) -> QIcon:
+        """Purple M icon for the taskbar/dock, painted on first use"""
+        if cls._cached_icon is None:
+            cls._cached_icon = cls._create_app_icon()
+        return cls._cached_icon
+
+    @staticmethod
+    def _create_app_icon() -> QIcon:
         """Create a purple M icon for the taskbar/dock"""
         size = 128
         pixmap = QPixmap(size, size)
@@ -2212,13 +2900,42 @@ class MainWindow(QMainWindow):
 
         # Draw white "M"
         painter.setPen(QPen(QColor("white")))
-        font = QFont("Segoe UI", 72, QFont.Weight.Bold)
+        font = _ui_font(72, bold=True)
         painter.setFont(font)
         painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "M")
 
         painter.end()
         return QIcon(pixmap)
 
+    @classmethod
+    def _phone_icon(cls) -> QIcon:
+        """Handset shown on phone tabs in place of an emoji in the title, painted on first use"""
+        if cls._cached_phone_icon is None:
+            cls._cached_phone_icon = cls._create_phone_icon()
+        return cls._cached_phone_icon
+
+    @staticmethod
+    def _create_phone_icon() -> QIcon:
+        """Paint a blue telephone handset"""
+        pixmap = QPixmap(32, 32)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        color = QColor("#1a73e8")
+
+        # Handle curving from the earpiece down to the mouthpiece
+        painter.setPen(QPen(color, 4, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        painter.drawArc(QRectF(7, -13, 38, 38), 180 * 16, 90 * 16)
+
+        # Earpiece and mouthpiece
+        painter.setPen(QPen(color, 7, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        painter.drawLine(QPointF(5, 5), QPointF(11, 3))
+        painter.drawLine(QPointF(27, 21), QPointF(29, 27))
+
+        painter.end()
+        return QIcon(pixmap)
+
     def _setup_ui(self):
         central = QWidget()
         self.setCentralWidget(central)
@@ -2231,25 +2948,20 @@ class MainWindow(QMainWindow):
 
         # Logo/Icon and Title
         logo_label = QLabel("M")
-        logo_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        logo_label.setStyleSheet("""
-            background-color: #7c3aed;
-            color: white;
-            border-radius: 8px;
-            padding: 4px 12px;
-        """)
+        logo_label.setFont(_ui_font(28, bold=True))
+        logo_label.setStyleSheet(_LOGO_QSS)
         logo_label.setFixedSize(50, 50)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         top_bar.addWidget(logo_label)
 
         title = QLabel("Martinez Orders")
-        title.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        title.setFont(_ui_font(24, bold=True))
         title.setStyleSheet("color: #7c3aed; margin-left: 10px;")
         top_bar.addWidget(title)
 
         # Version label
         version_label = QLabel(f"v{APP_VERSION}")
-        version_label.setFont(QFont("Segoe UI", 10))
+        version_label.setFont(_ui_font(10))
         version_label.setStyleSheet("color: #999; margin-left: 10px;")
         top_bar.addWidget(version_label)
 
@@ -2257,62 +2969,29 @@ class MainWindow(QMainWindow):
 
         # Update button (hidden by default)
         self.update_btn = QPushButton("Update Available")
-        self.update_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.update_btn.setFont(_ui_font(11, bold=True))
         self.update_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 15px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        self.update_btn.setStyleSheet(_UPDATE_BTN_QSS)
         self.update_btn.setVisible(False)
         self.update_btn.clicked.connect(self._show_update_dialog)
         top_bar.addWidget(self.update_btn)
 
         # Check for updates button
         self.check_update_btn = QPushButton("Check Updates")
-        self.check_update_btn.setFont(QFont("Segoe UI", 10))
+        self.check_update_btn.setFont(_ui_font(10))
         self.check_update_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.check_update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f0f0f0;
-                color: #999;
-            }
-        """)
+        self.check_update_btn.setStyleSheet(_CHECK_UPDATE_BTN_QSS)
         self.check_update_btn.clicked.connect(self._check_for_updates)
         top_bar.addWidget(self.check_update_btn)
 
         # Status indicator
         self.status_frame = QFrame()
-        self.status_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3cd;
-                border: 1px solid #ffc107;
-                border-radius: 4px;
-                padding: 5px 10px;
-            }
-        """)
+        self.status_frame.setObjectName("statusFrame")
+        self.status_frame.setStyleSheet(_STATUS_FRAME_QSS)
         status_layout = QHBoxLayout(self.status_frame)
         status_layout.setContentsMargins(10, 5, 10, 5)
         self.status_label = QLabel("Asterisk: Connecting...")
-        self.status_label.setFont(QFont("Segoe UI", 11))
-        self.status_label.setStyleSheet("border: none;")
+        self.status_label.setFont(_ui_font(11))
         status_layout.addWidget(self.status_label)
         top_bar.addWidget(self.status_frame)
 
@@ -2322,48 +3001,15 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.tabCloseRequested.connect(self._close_tab)
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                background: #f5f5f5;
-            }
-            QTabBar::tab {
-                background: #e0e0e0;
-                color: #333;
-                padding: 10px 20px;
-                margin-right: 4px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            QTabBar::tab:selected {
-                background: white;
-                border: 1px solid #e0e0e0;
-                border-bottom: none;
-            }
-            QTabBar::tab:hover:!selected {
-                background: #d0d0d0;
-            }
-        """)
+        self.tab_widget.currentChanged.connect(self._on_current_tab_changed)
+        self.tab_widget.setStyleSheet(_TAB_WIDGET_QSS)
 
         # Add "+" button for new tab
         self.new_tab_btn = QPushButton("+")
         self.new_tab_btn.setFixedSize(30, 30)
-        self.new_tab_btn.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.new_tab_btn.setFont(_ui_font(16, bold=True))
         self.new_tab_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.new_tab_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border: none;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #1557b0;
-            }
-        """)
+        self.new_tab_btn.setStyleSheet(_NEW_TAB_BTN_QSS)
         self.new_tab_btn.clicked.connect(self._add_new_tab)
         self.tab_widget.setCornerWidget(self.new_tab_btn, Qt.Corner.TopRightCorner)
 
@@ -2372,91 +3018,177 @@ class MainWindow(QMainWindow):
         # Create first tab
         self._add_new_tab()
 
-    def _add_new_tab(self, phone: str = None) -> CustomerTab:
-        """Add a new customer tab"""
+    def _add_new_tab(self, phone: str = None) -> QWidget:
+        """Add a new customer tab; the CustomerTab itself is built once the tab is shown"""
         self.tab_counter += 1
-        tab = CustomerTab(self.woo_client, self.signals, self.order_statuses, self)
-        tab_title = f"📞 {phone[:12]}..." if phone and len(phone) > 12 else (f"📞 {phone}" if phone else "New")
-        index = self.tab_widget.addTab(tab, tab_title)
+        placeholder = _TabPlaceholder(phone)
+        icon = self._phone_icon() if phone else QIcon()
+        index = self.tab_widget.addTab(placeholder, icon, _phone_tab_title(phone))
         self.tab_widget.setCurrentIndex(index)
+        return placeholder
+
+    def _on_current_tab_changed(self, index: int):
+        # Deferred so a burst of incoming calls only builds the tab that ends up in front
+        if isinstance(self.tab_widget.widget(index), _TabPlaceholder):
+            QTimer.singleShot(0, self._materialize_current_tab)
+
+    def _materialize_current_tab(self):
+        """Swap the current placeholder for a real CustomerTab and run its pending search"""
+        index = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(index)
+        if not isinstance(placeholder, _TabPlaceholder):
+            return
 
-        if phone:
-            tab.search_phone(phone)
+        tab = CustomerTab(self.woo_client, self.signals, self.order_statuses, self, api_pool=self.api_pool)
+        tab.phone_changed.connect(functools.partial(self._reindex_tab, tab))
+        self._customer_tabs.add(tab)
+        self.tab_widget.blockSignals(True)  # the swap briefly moves the current index
+        self.tab_widget.insertTab(index, tab, self.tab_widget.tabIcon(index), self.tab_widget.tabText(index))
+        self.tab_widget.removeTab(index + 1)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
 
-        return tab
+        if placeholder.phone:
+            tab.search_phone(placeholder.phone)
 
     def _close_tab(self, index: int):
         """Close a tab - keep at least one tab open"""
         if self.tab_widget.count() > 1:
+            tab = self.tab_widget.widget(index)
             self.tab_widget.removeTab(index)
+            if tab in self._customer_tabs:
+                self._customer_tabs.discard(tab)
+                self._reindex_tab(tab, tab.phone_number, "")
+            tab.deleteLater()  # removeTab only detaches the page
         else:
             # Clear the last tab instead of closing
             tab = self.tab_widget.widget(0)
-            if isinstance(tab, CustomerTab):
+            if isinstance(tab, _TabPlaceholder):
+                tab.phone = None
+                self._set_tab_text(0, "New")
+                self.tab_widget.setTabIcon(0, QIcon())
+            elif tab in self._customer_tabs:
                 tab._clear_results()
                 tab.phone_input.clear()
-                self.tab_widget.setTabText(0, "New")
+                self._set_tab_text(0, "New")
+                self.tab_widget.setTabIcon(0, QIcon())
+
+    def _close_all_tabs(self):
+        """Remove every tab in one pass, last first, with the tab bar frozen"""
+        tab_bar = self.tab_widget.tabBar()
+        self.tab_widget.setUpdatesEnabled(False)
+        tab_bar.blockSignals(True)
+        for index in reversed(range(self.tab_widget.count())):
+            tab = self.tab_widget.widget(index)
+            self.tab_widget.removeTab(index)
+            tab.deleteLater()
+        self._phone_to_tabs.clear()
+        self._customer_tabs.clear()
+        tab_bar.blockSignals(False)
+        self.tab_widget.setUpdatesEnabled(True)
+
+    def closeEvent(self, event):
+        self._stop_ami()
+        self._close_all_tabs()
+        super().closeEvent(event)
+
+    def _set_tab_text(self, index: int, text: str):
+        """setTabText re-measures every tab, so skip it when the title is unchanged"""
+        if self.tab_widget.tabText(index) != text:
+            self.tab_widget.setTabText(index, text)
+
+    def _reindex_tab(self, tab: CustomerTab, old_phone: str, new_phone: str):
+        """Move a tab to the bucket of the phone it now searches for"""
+        bucket = self._phone_to_tabs.get(old_phone)
+        if bucket is not None:
+            bucket.discard(tab)
+            if not bucket:
+                del self._phone_to_tabs[old_phone]
+        if new_phone:
+            self._phone_to_tabs.setdefault(new_phone, set()).add(tab)
 
     def _connect_ami(self):
-        def connect_thread():
-            self.ami = AsteriskAMI(self.config, self.signals)
-            if self.ami.connect():
-                self.ami.start_listening()
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self.ami = AsteriskAMI(self.config, self.signals)
+        self._ami_thread = _AmiThread(self.ami, self)
+        self._ami_thread.start()
+
+    def _stop_ami(self):
+        """Wake the AMI loop and wait for its thread so Qt never destroys it mid-run"""
+        if self.ami:
+            self.ami.disconnect()
+        if self._ami_thread and not self._ami_thread.wait(self.AMI_STOP_TIMEOUT_MS):
+            # Still stuck in a socket call; let process exit end it like a daemon
+            # thread instead of Qt aborting when the running QThread is destroyed
+            logger.warning("AMI thread did not stop in time")
+            self._ami_thread.setParent(None)
+            sip.transferto(self._ami_thread, None)
 
     def _start_webhook_server(self):
+        # Only bind the port when phone notifications are wanted; Asterisk-only
+        # setups can turn it off with webhook_enabled: false or webhook_port: 0
+        if not self.config.settings.get('webhook_enabled', True):
+            logger.info("Webhook server disabled in settings")
+            return
         webhook_port = self.config.settings.get('webhook_port', 5039)
         self.webhook_server = WebhookServer(self.signals, port=webhook_port)
         self.webhook_server.start()
 
     def _update_status(self, connected: bool, message: str):
         if connected:
-            self.status_frame.setStyleSheet("""
-                QFrame {
-                    background-color: #d4edda;
-                    border: 1px solid #28a745;
-                    border-radius: 4px;
-                }
-            """)
             self.status_label.setText(f"✓ Asterisk: {message}")
-            self.status_label.setStyleSheet("color: #155724; border: none;")
         else:
-            self.status_frame.setStyleSheet("""
-                QFrame {
-                    background-color: #fff3cd;
-                    border: 1px solid #ffc107;
-                    border-radius: 4px;
-                }
-            """)
             self.status_label.setText(f"⚠ Asterisk: {message}")
-            self.status_label.setStyleSheet("color: #856404; border: none;")
+
+        state = "connected" if connected else "disconnected"
+        if self.status_frame.property("state") != state:
+            # Re-polish against the sheet set in _setup_ui instead of parsing a new one
+            self.status_frame.setProperty("state", state)
+            style = self.status_frame.style()
+            for widget in (self.status_frame, self.status_label):
+                style.unpolish(widget)
+                style.polish(widget)
 
     def _on_search_result(self, orders: list, phone: str):
         """Route search results to the appropriate tab and update tab title"""
-        # Find all tabs with this phone number and update them
-        for i in range(self.tab_widget.count()):
-            tab = self.tab_widget.widget(i)
-            if isinstance(tab, CustomerTab) and tab.phone_number == phone:
+        tabs = self._phone_to_tabs.get(phone)
+        if not tabs:
+            return  # every tab for this number was closed or moved on
+
+        # Tab title with customer name - the same for every tab showing this phone
+        name = None
+        if orders:
+            billing = orders[0].get('billing', {})
+            name = f"{billing.get('first_name', '')} {billing.get('last_name', '')}".strip()
+        tab_title = _result_tab_title(phone, name)
+
+        # Update the tabs waiting for this phone number
+        for tab in list(tabs):
+            i = self.tab_widget.indexOf(tab)
+            if i >= 0:
                 tab.display_results(orders, phone)
-                # Update tab title with customer name
-                if orders:
-                    billing = orders[0].get('billing', {})
-                    name = f"{billing.get('first_name', '')} {billing.get('last_name', '')}".strip()
-                    tab_title = name[:15] + "..." if len(name) > 15 else name
-                    self.tab_widget.setTabText(i, f"📞 {tab_title}" if tab_title else f"📞 {phone[:10]}")
-                else:
-                    self.tab_widget.setTabText(i, f"📞 {phone[:10]}...")
+                self._set_tab_text(i, tab_title)
+                if self.tab_widget.tabIcon(i).isNull():
+                    self.tab_widget.setTabIcon(i, self._phone_icon())  # a "New" tab that was searched by hand
 
     def _on_status_update_result(self, row: int, success: bool, message: str):
         """Route status update results to current tab"""
         current_tab = self.tab_widget.currentWidget()
-        if isinstance(current_tab, CustomerTab):
+        if current_tab in self._customer_tabs:
             current_tab.on_status_update_result(row, success, message)
 
     def _on_incoming_call(self, caller_id: str, event: dict):
-        """Handle incoming call - open new tab with caller info"""
-        # Create new tab for incoming call
-        tab = self._add_new_tab(caller_id)
+        """Handle incoming call - queue a tab for the caller, opened on the next event loop pass"""
+        self._pending_calls.append(caller_id)
+        if not self._incoming_call_timer.isActive():
+            self._incoming_call_timer.start()
+
+    def _flush_pending_calls(self):
+        """Open tabs for every call that arrived in the same burst, then raise the window once"""
+        self.tab_widget.setUpdatesEnabled(False)
+        while self._pending_calls:
+            self._add_new_tab(self._pending_calls.popleft())
+        self.tab_widget.setUpdatesEnabled(True)
 
         # Bring window to front
         self.showNormal()
@@ -2465,28 +3197,38 @@ class MainWindow(QMainWindow):
 
     def _check_for_updates(self, silent: bool = False):
         """Check GitHub for updates"""
+        if not self.check_update_btn.isEnabled():
+            return  # the shared checker is still running
         self.check_update_btn.setEnabled(False)
         self.check_update_btn.setText("Checking...")
         self._silent_update_check = silent
 
-        self.update_checker = UpdateChecker()
-        self.update_checker.update_available.connect(self._on_update_available)
-        self.update_checker.no_update.connect(self._on_no_update)
-        self.update_checker.error.connect(self._on_update_error)
-        self.update_checker.start()
+        self.update_checker.max_age = UPDATE_CACHE_TTL if silent else 0
+        QThreadPool.globalInstance().start(self.update_checker)
+
+    def _reset_check_update_btn(self):
+        """Put the check button back once a check finishes, touching only what changed"""
+        if not self.check_update_btn.isEnabled():
+            self.check_update_btn.setEnabled(True)
+        if self.check_update_btn.text() != "Check Updates":
+            self.check_update_btn.setText("Check Updates")
 
     def _on_update_available(self, version: str, download_url: str):
         """Called when a new version is available"""
-        self.check_update_btn.setEnabled(True)
-        self.check_update_btn.setText("Check Updates")
+        self._reset_check_update_btn()
 
-        # Store update info
-        self._pending_update_version = version
-        self._pending_update_url = download_url
+        # Same release already on the update button - leave the widget alone
+        already_shown = (not self.update_btn.isHidden()
+                         and version == getattr(self, '_pending_update_version', None)
+                         and download_url == getattr(self, '_pending_update_url', None))
+        if not already_shown:
+            # Store update info
+            self._pending_update_version = version
+            self._pending_update_url = download_url
 
-        # Show update button
-        self.update_btn.setText(f"Update to v{version}")
-        self.update_btn.setVisible(True)
+            # Show update button
+            self.update_btn.setText(f"Update to v{version}")
+            self.update_btn.setVisible(True)
 
         # If not silent, show dialog immediately
         if not getattr(self, '_silent_update_check', False):
@@ -2494,16 +3236,14 @@ class MainWindow(QMainWindow):
 
     def _on_no_update(self):
         """Called when app is up to date"""
-        self.check_update_btn.setEnabled(True)
-        self.check_update_btn.setText("Check Updates")
+        self._reset_check_update_btn()
 
         if not getattr(self, '_silent_update_check', False):
             QMessageBox.information(self, "Up to Date", f"You are running the latest version (v{APP_VERSION})")
 
     def _on_update_error(self, error: str):
         """Called when update check fails"""
-        self.check_update_btn.setEnabled(True)
-        self.check_update_btn.setText("Check Updates")
+        self._reset_check_update_btn()
 
         if not getattr(self, '_silent_update_check', False):
             QMessageBox.warning(self, "Update Check Failed", f"Could not check for updates:\n{error}")
@@ -2524,7 +3264,7 @@ def set_macos_dock_icon(pixmap: QPixmap):
         from AppKit import NSApplication, NSImage
         from PyQt6.QtCore import QBuffer, QIODevice
 
-        # Convert QPixmap to PNG bytes
+        # Convert QPixmap to PNG bytes - the painted window icon, so dock and window match
         buffer = QBuffer()
         buffer.open(QIODevice.OpenModeFlag.WriteOnly)
         pixmap.save(buffer, "PNG")